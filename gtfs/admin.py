@@ -2,6 +2,11 @@ import logging
 
 from django.contrib import admin, messages
 from django.contrib.gis.admin import OSMGeoAdmin
+from django.db.models import OuterRef, Subquery
+from django.template.defaultfilters import filesizeformat
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from parler.admin import TranslatableAdmin
 from requests import RequestException
@@ -16,10 +21,13 @@ from .models import (
     FareRule,
     Feed,
     FeedInfo,
+    ImportRun,
     RiderCategory,
     Route,
+    RouteStop,
     Shape,
     Stop,
+    StopDeparture,
     StopTime,
     Trip,
 )
@@ -27,10 +35,51 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+def format_import_phases(phases):
+    """Render the phases of an ImportProfiler profile as an HTML table."""
+
+    def megabytes(value):
+        return f"{value / 2 ** 20:.1f}" if value else "-"
+
+    return format_html(
+        "<table><tr><th>{}</th><th>{}</th><th>{}</th><th>{}</th><th>{}</th>"
+        "<th>{}</th><th>{}</th></tr>{}</table>",
+        _("phase"),
+        _("seconds"),
+        _("rows"),
+        _("rows/s"),
+        _("queries"),
+        _("max RSS increase (MB)"),
+        _("peak memory (MB)"),
+        format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td>"
+            "<td>{}</td><td>{}</td></tr>",
+            (
+                (
+                    phase["name"],
+                    f"{phase['seconds']:.2f}",
+                    phase["rows"],
+                    f"{phase['rows_per_second']:.0f}"
+                    if phase["rows_per_second"]
+                    else "-",
+                    phase["queries"],
+                    megabytes(phase.get("max_rss_increase")),
+                    megabytes(phase["peak_memory"]),
+                )
+                for phase in phases
+            ),
+        ),
+    )
+
+
 class FeedInline(admin.TabularInline):
     model = Feed
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).exclude_versions()
+
 
 class FeedInfoInline(admin.StackedInline):
     model = FeedInfo
@@ -64,9 +113,14 @@ class FeedAdmin(admin.ModelAdmin):
         "created_at",
         "imported_at",
         "fingerprint",
+        "etag",
+        "last_modified",
         "import_attempted_at",
         "last_import_successful",
         "last_import_error_message",
+        "serving_version",
+        "import_phases",
+        "import_runs",
         "routes",
         "stops",
         "trips",
@@ -78,17 +132,37 @@ class FeedAdmin(admin.ModelAdmin):
 
     last_import_successful.boolean = True
 
+    def import_phases(self, obj):
+        return format_import_phases(obj.import_profile)
+
+    import_phases.short_description = _("import phases")
+
+    def import_runs(self, obj):
+        url = reverse("admin:gtfs_importrun_changelist")
+        return format_html(
+            '<a href="{}?feed__id__exact={}">{}</a>',
+            url,
+            obj.id,
+            _("%(count)d import runs") % {"count": obj.import_runs.count()},
+        )
+
+    import_runs.short_description = _("import runs")
+
+    def get_queryset(self, request):
+        # versions are managed by the importer
+        return super().get_queryset(request).exclude_versions()
+
     def routes(self, obj):
-        return obj.routes.count()
+        return obj.data_feed.routes.count()
 
     def stops(self, obj):
-        return obj.stops.count()
+        return obj.data_feed.stops.count()
 
     def trips(self, obj):
-        return obj.trips.count()
+        return obj.data_feed.trips.count()
 
     def departures(self, obj):
-        return Departure.objects.filter(trip__feed=obj).count()
+        return Departure.objects.filter(trip__feed=obj.data_feed).count()
 
     def get_fieldsets(self, request, obj=None):
         if not obj:
@@ -98,10 +172,17 @@ class FeedAdmin(admin.ModelAdmin):
             "imported_at",
             "import_attempted_at",
             "fingerprint",
+            "etag",
+            "last_modified",
             "last_import_successful",
         )
         if obj.last_import_successful is False:
             import_fields += ("last_import_error_message",)
+        if obj.serving_version:
+            import_fields += ("serving_version",)
+        if obj.import_profile:
+            import_fields += ("import_phases",)
+        import_fields += ("import_runs",)
 
         return (
             (
@@ -147,6 +228,101 @@ class FeedAdmin(admin.ModelAdmin):
     update_feed.short_description = _("Update selected feeds")
 
 
+@admin.register(ImportRun)
+class ImportRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "started_at",
+        "feed",
+        "successful",
+        "duration",
+        "rows",
+        "rows_per_second_display",
+        "rows_per_second_change",
+        "bytes_written_display",
+    )
+    list_filter = ("feed", "successful")
+    date_hierarchy = "started_at"
+    readonly_fields = (
+        "feed",
+        "started_at",
+        "finished_at",
+        "duration",
+        "fingerprint",
+        "successful",
+        "error_message",
+        "rows",
+        "rows_per_second_display",
+        "rows_per_second_change",
+        "bytes_written_display",
+        "row_counts_display",
+        "import_phases",
+    )
+    exclude = ("row_counts", "phases", "bytes_written", "rows_per_second")
+
+    def get_queryset(self, request):
+        # throughput of the feed's previous successful import, to spot regressions
+        previous_runs = ImportRun.objects.filter(
+            feed=OuterRef("feed"),
+            started_at__lt=OuterRef("started_at"),
+            successful=True,
+        ).order_by("-started_at")
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("feed")
+            .annotate(
+                previous_rows_per_second=Subquery(
+                    previous_runs.values("rows_per_second")[:1]
+                )
+            )
+        )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def rows(self, obj):
+        return sum(obj.row_counts.values())
+
+    rows.short_description = _("rows")
+
+    def rows_per_second_display(self, obj):
+        return f"{obj.rows_per_second:.0f}" if obj.rows_per_second else None
+
+    rows_per_second_display.short_description = _("rows per second")
+    rows_per_second_display.admin_order_field = "rows_per_second"
+
+    def rows_per_second_change(self, obj):
+        if not obj.rows_per_second or not obj.previous_rows_per_second:
+            return None
+        change = obj.rows_per_second / obj.previous_rows_per_second - 1
+        return f"{change:+.0%}"
+
+    rows_per_second_change.short_description = _("change from previous")
+
+    def bytes_written_display(self, obj):
+        if obj.bytes_written is None:
+            return None
+        return filesizeformat(obj.bytes_written)
+
+    bytes_written_display.short_description = _("bytes written")
+    bytes_written_display.admin_order_field = "bytes_written"
+
+    def row_counts_display(self, obj):
+        return format_html_join(
+            mark_safe("<br>"), "{}: {}", sorted(obj.row_counts.items())
+        )
+
+    row_counts_display.short_description = _("row counts")
+
+    def import_phases(self, obj):
+        return format_import_phases(obj.phases)
+
+    import_phases.short_description = _("phases")
+
+
 @admin.register(Shape)
 class ShapeAdmin(OSMGeoAdmin):
     list_filter = ("feed",)
@@ -171,6 +347,8 @@ admin.site.register(FareRiderCategory, FeedFilterAdmin)
 admin.site.register(FareRule, FeedFilterAdmin)
 admin.site.register(RiderCategory, FeedFilterTranslatableAdmin)
 admin.site.register(Route, FeedFilterTranslatableAdmin)
+admin.site.register(RouteStop, FeedFilterAdmin)
 admin.site.register(Stop, FeedFilterTranslatableAdmin)
+admin.site.register(StopDeparture, FeedFilterAdmin)
 admin.site.register(StopTime, FeedFilterTranslatableAdmin)
 admin.site.register(Trip, FeedFilterTranslatableAdmin)
@@ -1,8 +1,40 @@
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
+from parler import appsettings
+from parler.utils.i18n import get_language
 from rest_framework import serializers, viewsets
 from rest_framework.exceptions import ParseError
 
 
+def get_translations_prefetch(model, lookup="translations"):
+    """Prefetch the model's translations in the active language and its fallbacks.
+
+    parler uses prefetched translations instead of querying them object by object,
+    the prefetch needs to include the fallback languages for them to work.
+    """
+    language = get_language()
+    languages = [
+        language,
+        *appsettings.PARLER_LANGUAGES.get_fallback_languages(language),
+    ]
+    return Prefetch(
+        lookup,
+        queryset=model._parler_meta.root_model.objects.filter(
+            language_code__in=languages
+        ),
+    )
+
+
+def prefetch_translations(instances, model):
+    """Prefetch the translations of the instances, unless there is only one object.
+
+    parler looks up the translations of a single object from its cache, which is at
+    most as many queries as the prefetch.
+    """
+    if len({instance.pk for instance in instances}) > 1:
+        prefetch_related_objects(instances, get_translations_prefetch(model))
+
+
 class BaseGTFSViewSet(viewsets.ReadOnlyModelViewSet):
     lookup_field = "api_id"
 
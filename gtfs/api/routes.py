@@ -1,11 +1,20 @@
+from collections import defaultdict
+
+from django.db import models
+from django.db.models import F, Prefetch, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import extend_schema, extend_schema_field, extend_schema_view
 from rest_framework import serializers
 
-from gtfs.api.base import BaseGTFSViewSet, NestedDepartureQueryParamsSerializer
+from gtfs.api.base import (
+    BaseGTFSViewSet,
+    get_translations_prefetch,
+    NestedDepartureQueryParamsSerializer,
+    prefetch_translations,
+)
 from gtfs.api.stops import StopSerializer
-from gtfs.models import Agency, Fare, FareRiderCategory, Route, Stop
+from gtfs.models import Agency, Fare, FareRiderCategory, RiderCategory, Route, Stop
 
 
 class AgencySerializer(serializers.ModelSerializer):
@@ -35,9 +44,22 @@ class FareSerializer(serializers.ModelSerializer):
     )
 
 
+class RouteListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        routes = list(data.all() if isinstance(data, models.Manager) else data)
+        # fetch the translations, stops and ticket types of all of the routes at once
+        # instead of per route
+        prefetch_translations(routes, Route)
+        prefetch_translations([route.agency for route in routes], Agency)
+        self.child.prefetch_stops(routes)
+        self.child.prefetch_ticket_types(routes)
+        return super().to_representation(routes)
+
+
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
+        list_serializer_class = RouteListSerializer
         fields = (
             "id",
             "name",
@@ -58,31 +80,71 @@ class RouteSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(StopSerializer(many=True))
     def get_stops(self, obj):
-        stops = (
-            Stop.objects.filter(stop_times__trip__route_id=obj.id)
-            .distinct()
-            .order_by("id")
-        )
+        if not hasattr(obj, "served_stops"):
+            self.prefetch_stops([obj])
         return StopSerializer(
-            stops, many=True, context=dict(**self.context, route_id=obj.id)
+            obj.served_stops, many=True, context=dict(**self.context, route_id=obj.id)
         ).data
 
     @extend_schema_field(FareSerializer(many=True))
     def get_ticket_types(self, obj):
-        ticket_types = (
-            Fare.objects.filter(fare_rules__route_id=obj.id)
+        if not hasattr(obj, "route_ticket_types"):
+            self.prefetch_ticket_types([obj])
+        return FareSerializer(
+            obj.route_ticket_types, many=True, context=self.context
+        ).data
+
+    @staticmethod
+    def prefetch_stops(routes):
+        """Fetch the stops of the routes to their served_stops in a single query.
+
+        The stops come from the route stops populated at import. A stop served in
+        both directions is included only once.
+        """
+        prefetch_related_objects(
+            routes,
+            Prefetch(
+                "stops",
+                queryset=Stop.objects.distinct()
+                .order_by("id")
+                .prefetch_related(get_translations_prefetch(Stop)),
+                to_attr="served_stops",
+            ),
+        )
+
+    @staticmethod
+    def prefetch_ticket_types(routes):
+        """Fetch the fares of the routes to their route_ticket_types in one query."""
+        fares = list(
+            Fare.objects.filter(fare_rules__route__in=routes)
+            .annotate(route_id=F("fare_rules__route_id"))
             .distinct()
+            .order_by("id")
             .prefetch_related(
-                "fare_rider_categories", "fare_rider_categories__rider_category"
+                Prefetch(
+                    "fare_rider_categories",
+                    queryset=FareRiderCategory.objects.select_related("rider_category"),
+                )
             )
         )
-        return FareSerializer(ticket_types, many=True, context=self.context).data
+        prefetch_translations(fares, Fare)
+        prefetch_translations(
+            [
+                fare_rider_category.rider_category
+                for fare in fares
+                for fare_rider_category in fare.fare_rider_categories.all()
+            ],
+            RiderCategory,
+        )
+        route_ticket_types = defaultdict(list)
+        for fare in fares:
+            route_ticket_types[fare.route_id].append(fare)
+        for route in routes:
+            route.route_ticket_types = route_ticket_types[route.id]
 
 
 class RouteFilter(filters.FilterSet):
-    stop_id = filters.UUIDFilter(
-        field_name="trips__stop_times__stop__api_id", distinct=True
-    )
+    stop_id = filters.UUIDFilter(field_name="stops__api_id", distinct=True)
 
     class Meta:
         model: Route
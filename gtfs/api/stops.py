@@ -1,14 +1,18 @@
-from django.db.models import Prefetch
+from django.db import models
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
-from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_field, extend_schema_view
+from pytz import utc
 from rest_framework import serializers
 from rest_framework_gis.filters import DistanceToPointFilter
 
-from gtfs.models import Stop, StopTime
-from gtfs.models.departure import Departure
+from gtfs.models import Stop, StopDeparture, StopTime, Trip
 
-from .base import BaseGTFSViewSet, NestedDepartureQueryParamsSerializer
+from .base import (
+    BaseGTFSViewSet,
+    get_translations_prefetch,
+    NestedDepartureQueryParamsSerializer,
+)
 
 
 class CoordinateSerializer(serializers.Serializer):
@@ -17,27 +21,28 @@ class CoordinateSerializer(serializers.Serializer):
 
 
 class StopTimeSerializer(serializers.ModelSerializer):
-    id = serializers.SerializerMethodField()
-    short_name = serializers.CharField(source="trip.short_name")
-    arrival_time = serializers.SerializerMethodField()
-    departure_time = serializers.SerializerMethodField()
-    direction_id = serializers.IntegerField(source="trip.direction_id")
-    departure_headsign = serializers.CharField(source="trip.headsign")
-    stop_headsign = serializers.CharField()
-    stop_sequence = serializers.IntegerField()
+    id = serializers.UUIDField(source="api_id", read_only=True)
+    short_name = serializers.CharField(source="stop_time.trip.short_name")
+    # the times are in UTC like they are stored
+    arrival_time = serializers.DateTimeField(default_timezone=utc, read_only=True)
+    departure_time = serializers.DateTimeField(default_timezone=utc, read_only=True)
+    direction_id = serializers.IntegerField()
+    departure_headsign = serializers.CharField(source="stop_time.trip.headsign")
+    stop_headsign = serializers.CharField(source="stop_time.stop_headsign")
+    stop_sequence = serializers.IntegerField(source="stop_time.stop_sequence")
     stops_after_this = serializers.IntegerField()
     wheelchair_accessible = serializers.IntegerField(
-        source="trip.wheelchair_accessible"
+        source="stop_time.trip.wheelchair_accessible"
     )
-    bikes_allowed = serializers.IntegerField(source="trip.bikes_allowed")
+    bikes_allowed = serializers.IntegerField(source="stop_time.trip.bikes_allowed")
     route_id = serializers.SlugRelatedField(
-        source="trip.route", slug_field="api_id", read_only=True
+        source="route", slug_field="api_id", read_only=True
     )
-    block_id = serializers.CharField(source="trip.block_id")
-    timepoint = serializers.IntegerField()
+    block_id = serializers.CharField(source="stop_time.trip.block_id")
+    timepoint = serializers.IntegerField(source="stop_time.timepoint")
 
     class Meta:
-        model = StopTime
+        model = StopDeparture
         fields = (
             "id",
             "short_name",
@@ -61,25 +66,19 @@ class StopTimeSerializer(serializers.ModelSerializer):
             del fields["route_id"]
         return fields
 
-    @extend_schema_field(OpenApiTypes.UUID)
-    def get_id(self, obj):
-        departure = obj.trip.dates_departure[0]
-        return departure.api_id
-
-    @extend_schema_field(OpenApiTypes.DATETIME)
-    def get_arrival_time(self, obj):
-        departure = obj.trip.dates_departure[0]
-        return obj.get_arrival_time_datetime(departure)
 
-    @extend_schema_field(OpenApiTypes.DATETIME)
-    def get_departure_time(self, obj):
-        departure = obj.trip.dates_departure[0]
-        return obj.get_departure_time_datetime(departure)
+class StopListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        stops = list(data.all() if isinstance(data, models.Manager) else data)
+        # fetch the departures of all of the stops at once instead of per stop
+        self.child.prefetch_departures(stops)
+        return super().to_representation(stops)
 
 
 class StopSerializer(serializers.ModelSerializer):
     class Meta:
         model = Stop
+        list_serializer_class = StopListSerializer
         fields = (
             "id",
             "name",
@@ -111,30 +110,43 @@ class StopSerializer(serializers.ModelSerializer):
         if "date" not in self.context:
             return None
 
+        if not hasattr(obj, "date_departures"):
+            self.prefetch_departures([obj])
+        return StopTimeSerializer(
+            obj.date_departures, many=True, context=self.context
+        ).data
+
+    def prefetch_departures(self, stops):
+        """Fetch the stops' departures of the date to their date_departures.
+
+        The departures of all of the stops are read from the stop departures
+        populated at import in a single query, along with their stop times, trips
+        and routes. The translations of the trips and the stop times are prefetched
+        too, parler would otherwise look them up departure by departure.
+        """
+        if "date" not in self.context:
+            return
+
         queryset = (
-            StopTime.objects.filter(
-                stop=obj, trip__departures__date=self.context["date"]
-            )
-            .select_related("trip", "trip__route", "trip__route__agency")
+            StopDeparture.objects.filter(date=self.context["date"])
+            .select_related("stop_time", "stop_time__trip", "route")
             .prefetch_related(
-                Prefetch(
-                    "trip__departures",
-                    queryset=Departure.objects.filter(
-                        date=self.context["date"], trip__stop_times__stop=obj
-                    ),
-                    to_attr="dates_departure",
-                )
+                get_translations_prefetch(Trip, "stop_time__trip__translations"),
+                get_translations_prefetch(StopTime, "stop_time__translations"),
             )
             .order_by("departure_time")
         )
         if "direction_id" in self.context:
-            queryset = queryset.filter(trip__direction_id=self.context["direction_id"])
+            queryset = queryset.filter(direction_id=self.context["direction_id"])
         if "route_id" in self.context:
-            queryset = queryset.filter(trip__route_id=self.context["route_id"])
+            queryset = queryset.filter(route_id=self.context["route_id"])
         if self.context.get("exclude_final_stop_departures", False):
             queryset = queryset.exclude(stops_after_this=0)
 
-        return StopTimeSerializer(queryset, many=True, context=self.context).data
+        prefetch_related_objects(
+            stops,
+            Prefetch("stop_departures", queryset=queryset, to_attr="date_departures"),
+        )
 
 
 class RadiusToLocationFilter(DistanceToPointFilter):
@@ -0,0 +1,127 @@
+import io
+from datetime import timedelta
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from django.contrib.gis.db import models
+from django.db import connection
+
+from gtfs.importers.import_profiler import ImportProfiler
+
+
+class CopyStream(io.TextIOBase):
+    """Read-only file-like object that lazily joins an iterator of strings.
+
+    psycopg2's copy_expert() reads the data in chunks, so this allows streaming
+    rows into COPY without building the whole payload in memory first.
+    """
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while size is None or size < 0 or length < size:
+            try:
+                line = next(self._lines)
+            except StopIteration:
+                break
+            parts.append(line)
+            length += len(line)
+        data = "".join(parts)
+        if size is None or size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        return data[:size]
+
+
+class CopyLoader:
+    """Load rows into PostgreSQL tables with COPY FROM STDIN.
+
+    Values need to be already converted to what the model fields expect, this class
+    only takes care of serializing them to PostgreSQL's text COPY format.
+
+    COPY bypasses Django's execute wrappers, so it is counted with the given
+    profiler's count_query().
+    """
+
+    def __init__(self, profiler: Optional[ImportProfiler] = None):
+        self.profiler = profiler
+
+    def reserve_ids(self, model, count: int) -> List[int]:
+        """Reserve primary key values from the model's sequence.
+
+        This makes it possible to know the IDs of the rows beforehand, COPY cannot
+        return them.
+        """
+        if not count:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+                "FROM generate_series(1, %s)",
+                [model._meta.db_table, model._meta.pk.column, count],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def copy(self, model, fields: Sequence[models.Field], rows: Iterable[Sequence]):
+        """COPY the given rows into the model's table.
+
+        Every row is a sequence of values, one for each field in the given order.
+        Returns the number of copied rows.
+        """
+        num_of_rows = 0
+
+        def lines():
+            nonlocal num_of_rows
+            for row in rows:
+                num_of_rows += 1
+                yield "\t".join(
+                    self._format_value(field, value)
+                    for field, value in zip(fields, row)
+                ) + "\n"
+
+        quote_name = connection.ops.quote_name
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN",
+                CopyStream(lines()),
+            )
+        if self.profiler:
+            self.profiler.count_query()
+
+        return num_of_rows
+
+    @staticmethod
+    def _format_value(field, value) -> str:
+        if value is None:
+            return r"\N"
+
+        if isinstance(field, models.GeometryField):
+            if value.srid is None:
+                value.srid = field.srid
+            return value.hexewkb.decode()
+
+        value = field.get_db_prep_save(value, connection)
+        if value is None:
+            return r"\N"
+        elif isinstance(value, bool):
+            return "t" if value else "f"
+        elif isinstance(value, timedelta):
+            return (
+                f"{value.days} days {value.seconds} seconds "
+                f"{value.microseconds} microseconds"
+            )
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
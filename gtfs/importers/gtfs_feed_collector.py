@@ -0,0 +1,85 @@
+import logging
+
+from django.db import transaction
+
+from gtfs.models import (
+    Agency,
+    Departure,
+    Fare,
+    FareRiderCategory,
+    FareRule,
+    Feed,
+    FeedInfo,
+    RiderCategory,
+    Route,
+    RouteStop,
+    Shape,
+    Stop,
+    StopDeparture,
+    StopTime,
+    Trip,
+)
+
+
+class GTFSFeedCollector:
+    """Delete the GTFS data that is no longer served after staged imports.
+
+    That is the feed versions that aren't any feed's serving version, and the feed's
+    own data of feeds that are served from a version. The data is deleted in small
+    batches, each in a transaction of its own, so that the deletion never holds
+    locks for long.
+    """
+
+    # in the order the data is deleted in, objects are deleted before the objects
+    # they refer to so that the deletions don't cascade
+    MODELS = (
+        (StopDeparture, "feed"),
+        (Departure, "trip__feed"),
+        (RouteStop, "feed"),
+        (StopTime, "feed"),
+        (FareRiderCategory, "feed"),
+        (FareRule, "feed"),
+        (FeedInfo, "feed"),
+        (Trip, "feed"),
+        (Shape, "feed"),
+        (Route, "feed"),
+        (Stop, "feed"),
+        (Fare, "feed"),
+        (RiderCategory, "feed"),
+        (Agency, "feed"),
+    )
+
+    def __init__(self, logger=None, batch_size=5000):
+        self.logger = logger or logging.getLogger(__name__)
+        self.batch_size = batch_size
+
+    def collect(self):
+        """Delete all the data that is no longer served."""
+        retired_versions = Feed.objects.filter(version_of__isnull=False).exclude(
+            pk__in=Feed.objects.filter(serving_version__isnull=False).values(
+                "serving_version"
+            )
+        )
+        for version in retired_versions:
+            self.logger.info(f'Deleting retired version {version.id} of "{version}"...')
+            self._delete_data(version)
+            version.delete()
+
+        for feed in Feed.objects.exclude_versions().filter(
+            serving_version__isnull=False
+        ):
+            self._delete_data(feed)
+
+    def _delete_data(self, feed):
+        for model, feed_lookup in self.MODELS:
+            queryset = model.objects.filter(**{feed_lookup: feed})
+            num_of_deleted = 0
+            while ids := list(queryset.values_list("pk", flat=True)[: self.batch_size]):
+                with transaction.atomic():
+                    model.objects.filter(pk__in=ids).delete()
+                num_of_deleted += len(ids)
+            if num_of_deleted:
+                self.logger.debug(
+                    f"Deleted {num_of_deleted} {model._meta.verbose_name_plural} of "
+                    f'"{feed}"'
+                )
@@ -1,38 +1,78 @@
 import logging
+import struct
 from collections import defaultdict
-from datetime import datetime
-from math import isnan
+from functools import partial
+from itertools import islice
+from pathlib import Path
 from timeit import default_timer as timer
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import gtfs_kit
+import numpy as np
+import pandas as pd
+from django.conf import settings
 from django.contrib.gis.db import models
-from django.contrib.gis.geos import LineString, Point
-from django.db import transaction
+from django.contrib.gis.geos import GEOSGeometry, Point
+from django.db import connection, transaction
 from django.utils import timezone
-from parler.utils.context import switch_language
+from pandas.api.types import is_integer_dtype
+from parler import appsettings
+from parler.utils.i18n import get_language, normalize_language_code
 
-from gtfs.importers.gtfs_feed_reader import GTFSFeedReader
+from gtfs.importers.copy_loader import CopyLoader
+from gtfs.importers.gtfs_feed_reader import FeedDownload, GTFSFeedReader
+from gtfs.importers.import_profiler import ImportProfiler
 from gtfs.models import (
     Agency,
     Departure,
     Fare,
     FareRiderCategory,
     FareRule,
+    Feed,
     FeedInfo,
     RiderCategory,
     Route,
+    RouteStop,
     Shape,
     Stop,
+    StopDeparture,
     StopTime,
     Trip,
 )
 
+# WKB geometry type code of a LineString
+WKB_LINESTRING = 2
+
 
 class GTFSFeedImporterError(Exception):
     pass
 
 
+class FieldConversion(NamedTuple):
+    model_field_name: str
+    gtfs_field: Union[str, Tuple[str, ...]]
+    translated: bool
+    convert: Callable[[pd.Series], List]
+
+
+class GTFSFeedData(NamedTuple):
+    gtfs_feed: gtfs_kit.Feed
+    fingerprint: str
+    download: Optional[FeedDownload]
+    # set when the chunked tables haven't been read yet and are read from here
+    path: Optional[Path] = None
+    skip_validation: bool = False
+    # the profiled phases of reading the feed, see ImportProfiler
+    phases: Tuple[Dict, ...] = ()
+
+
 class GTFSFeedImporter:
+    # "orm" creates objects using the Django ORM, "copy" streams the data straight
+    # into the tables using PostgreSQL's COPY
+    LOAD_ENGINE_ORM = "orm"
+    LOAD_ENGINE_COPY = "copy"
+    LOAD_ENGINES = (LOAD_ENGINE_ORM, LOAD_ENGINE_COPY)
+
     MODELS_AND_GTFS_KIT_ATTRIBUTES = (
         (Agency, "agency"),
         (Route, "routes"),
@@ -52,10 +92,25 @@ class GTFSFeedImporter:
         "language",
         "translation",
         "record_id",
+        "record_sub_id",
     ]
 
     TRANSLATIONS = "translations"
 
+    # tables that can be read and imported in chunks, and the columns whose rows
+    # are kept in the same chunk
+    CHUNKED_TABLES = {"stop_times": "trip_id", "shapes": "shape_id"}
+
+    # Fields identifying an object within a feed in incremental imports, objects of
+    # the other models are identified by their source_id. A feed has only one
+    # FeedInfo.
+    NATURAL_KEYS = {
+        StopTime: ("trip_id", "stop_sequence"),
+        FareRule: ("fare_id", "route_id"),
+        FareRiderCategory: ("fare_id", "rider_category_id"),
+        FeedInfo: (),
+    }
+
     # Mapping from GTFSModel field to GTFS field.
     # GTFS field can contain multiple values.
     FIELD_MAPPING = {
@@ -144,13 +199,59 @@ class GTFSFeedImporter:
         self,
         object_creation_batch_size=2000,  # Stetson-Harrison method
         logger=None,
+        load_engine=LOAD_ENGINE_ORM,
+        # departures are tiny rows, so bigger batches pay off
+        departure_creation_batch_size=20000,
+        incremental=False,
+        chunk_size=None,
+        trace_memory=False,
+        staging=False,
     ):
+        if load_engine not in self.LOAD_ENGINES:
+            raise ValueError(
+                f'Invalid load engine "{load_engine}", '
+                f"choices are: {', '.join(self.LOAD_ENGINES)}"
+            )
+        if incremental and chunk_size:
+            raise ValueError("Incremental imports cannot be done in chunks.")
+        if incremental and staging:
+            raise ValueError("Incremental imports cannot be staged.")
         self.object_creation_batch_size = object_creation_batch_size
+        self.departure_creation_batch_size = departure_creation_batch_size
         self.logger = logger or logging.getLogger(__name__)
-        self.feed_reader = GTFSFeedReader()
+        self.load_engine = load_engine
+        # incremental imports write only the objects that have changed instead of
+        # deleting the feed's data and importing all of it again
+        self.incremental = incremental
+        # when set, stop times and shapes are read and imported this many rows at a
+        # time instead of reading them into memory all at once
+        self.chunk_size = chunk_size
+        # staged imports import the data into a new version of the feed and switch
+        # to serving it when done, so the served data is never locked or deleted
+        # during the import. The old version is left for GTFSFeedCollector.
+        self.staging = staging
+        self.feed_reader = GTFSFeedReader(cache_dir=settings.GTFS_FEED_CACHE_ROOT)
+        # measures the phases of the latest import
+        self.profiler = ImportProfiler(trace_memory=trace_memory)
+        self.copy_loader = CopyLoader(profiler=self.profiler)
+        # number of imported rows by GTFS table in the latest import
+        self.row_counts = {}
+        # bytes of write-ahead log generated by the latest import, PostgreSQL only
+        self.bytes_written = None
         # IDs of all created objects that have a source ID are cached so that we can
         # use them to populate foreign key fields of later imported object types
         self.id_cache = defaultdict(dict)
+        # how each model's fields are converted, compiled on first use
+        self.conversion_plans = {}
+        # IDs of objects that are no longer in the feed, found by incremental imports
+        self.ids_to_delete = {}
+        # IDs of objects that incremental imports updated, and of the trips whose
+        # stop times, departures or stops_after_this changed
+        self.updated_ids = {}
+        self.changed_trip_ids = set()
+        # languages of the translations created along with the objects, incremental
+        # imports keep these when deleting translations no longer in the feed
+        self.base_languages = {}
 
         # Save feed_lang, when looping through models we need access to this value
         self.feed_lang = ""
@@ -160,58 +261,248 @@ class GTFSFeedImporter:
         self.logger.info(
             f'Importing GTFS feed "{feed_name}" from "{feed.url_or_path}"...'
         )
-
-        self.id_cache.clear()
+        self._check_load_engine()
         start_time = timer()
 
+        feed_data = self.read(feed, skip_validation)
+        self.load(feed, feed_data)
+
+        end_time = timer()
+        feed_name = feed.name or "<no name>"
+        self.logger.info(
+            f'Successfully imported GTFS feed "{feed_name}" from "{feed.url_or_path}" '
+            f"in {end_time - start_time:.2f} secs!"
+        )
+
+    def read(self, feed, skip_validation=False) -> GTFSFeedData:
+        """Read and validate the feed.
+
+        This doesn't access the database, so feeds can be read in worker processes
+        and then loaded one at a time.
+        """
         self.logger.info("Reading data...")
+        self.profiler.reset()
+        chunked_tables = self.CHUNKED_TABLES if self.chunk_size else {}
         try:
-            gtfs_feed = self.feed_reader.read_feed(feed.url_or_path)
-        except ValueError as e:
+            with self.profiler.phase("read") as phase:
+                gtfs_feed = self.feed_reader.read_feed(
+                    feed.url_or_path, skip_tables=chunked_tables
+                )
+                phase.rows = self._count_rows(gtfs_feed, chunked_tables)
+            # a feed read from a URL has been downloaded, so this doesn't need any
+            # more requests. Downloads are cached, so the path is still valid after
+            # the cleanup.
+            path = (
+                self.feed_reader.get_local_path(feed.url_or_path)
+                if chunked_tables
+                else None
+            )
+            fingerprint = self.feed_reader.get_feed_fingerprint(feed)
+            download = self.feed_reader.downloads.get(feed.url_or_path)
+        except (ValueError, TypeError) as e:
             raise GTFSFeedImporterError(f"Error reading GTFS feed: {str(e)}") from e
+        finally:
+            self.feed_reader.cleanup()
 
         if not skip_validation:
             self.logger.debug("Validating data...")
-            if results := self.feed_reader.validate(gtfs_feed):
-                if any(r[0] == "error" for r in results):
-                    message = f"Validation errors and warnings: {results}"
-                    self.logger.error(message)
-                    raise GTFSFeedImporterError(message)
-                else:
-                    self.logger.debug(f"Validation warnings: {results}")
-
-        with transaction.atomic():
-            self._delete_existing_gtfs_objects(feed)
-
-            self._import_shapes(feed, gtfs_feed)
-            for model, gtfs_attribute in self.MODELS_AND_GTFS_KIT_ATTRIBUTES:
-                self._import_model(feed, model, getattr(gtfs_feed, gtfs_attribute))
+            with self.profiler.phase("validate") as phase:
+                problems = self.feed_reader.validate(
+                    gtfs_feed, skip_tables=chunked_tables
+                )
+                phase.rows = self._count_rows(gtfs_feed, chunked_tables)
+            self._raise_for_problems(problems)
+
+        return GTFSFeedData(
+            gtfs_feed,
+            fingerprint,
+            download,
+            path,
+            skip_validation,
+            tuple(self.profiler.as_list()),
+        )
 
-            self._create_departures(gtfs_feed)
-            self._populate_stop_times_last_field(feed)
+    def load(self, feed, feed_data: GTFSFeedData):
+        """Write the read feed's data to the database.
 
-            feed.fingerprint = self.feed_reader.get_feed_fingerprint(feed)
+        The data is written to the feed's serving data, or to a new version of the
+        feed when staging. The feed starts serving the new version when the
+        transaction is committed.
+        """
+        self._check_load_engine()
 
-            translation_list = self._form_translation_list(
-                getattr(gtfs_feed, self.TRANSLATIONS)
-            )
+        self.id_cache.clear()
+        self.ids_to_delete.clear()
+        self.updated_ids.clear()
+        self.changed_trip_ids.clear()
+        self.base_languages.clear()
+        self.feed_lang = ""
+        self.row_counts.clear()
+        self.bytes_written = None
+        gtfs_feed = feed_data.gtfs_feed
+        wal_position = self._get_wal_position()
+        # continue the profile of reading the feed, it may have been read elsewhere
+        self.profiler.reset(feed_data.phases)
+        phase = self.profiler.phase
 
+        with transaction.atomic():
+            data_feed = self._create_version(feed) if self.staging else feed.data_feed
+            if not self.incremental and not self.staging:
+                with phase("delete"):
+                    self._delete_existing_gtfs_objects(data_feed)
+
+            # chunked tables are read and validated a chunk at a time, which is
+            # included in their import phases
+            with phase("import shapes") as shapes_phase:
+                for gtfs_data in self._read_table(feed_data, "shapes"):
+                    shapes_phase.rows += self._import_shapes(data_feed, gtfs_data)
+            self.row_counts["shapes"] = shapes_phase.rows
             for model, gtfs_attribute in self.MODELS_AND_GTFS_KIT_ATTRIBUTES:
-                self._add_translations(model, gtfs_attribute, translation_list, feed)
+                with phase(f"import {gtfs_attribute}") as model_phase:
+                    for gtfs_data in self._read_table(feed_data, gtfs_attribute):
+                        model_phase.rows += self._import_model(
+                            data_feed, model, gtfs_data
+                        )
+                self.row_counts[gtfs_attribute] = model_phase.rows
+
+            with phase("departures") as departures_phase:
+                departures_phase.rows = self._create_departures(data_feed, gtfs_feed)
+            self.row_counts["departures"] = departures_phase.rows
+            if self.incremental:
+                with phase("delete removed"):
+                    self._delete_removed_gtfs_objects()
+            with phase("stops_after_this") as stops_after_this_phase:
+                stops_after_this_phase.rows = self._populate_stop_times_last_field(
+                    data_feed
+                )
+            with phase("route stops") as route_stops_phase:
+                route_stops_phase.rows = self._populate_route_stops(data_feed)
+            with phase("stop departures") as stop_departures_phase:
+                stop_departures_phase.rows = self._populate_stop_departures(data_feed)
+
+            feed.fingerprint = feed_data.fingerprint
+            if download := feed_data.download:
+                feed.etag = download.etag
+                feed.last_modified = download.last_modified
+
+            with phase("translations") as translations_phase:
+                translation_index = self._form_translation_index(
+                    getattr(gtfs_feed, self.TRANSLATIONS)
+                )
+                for model, gtfs_attribute in self.MODELS_AND_GTFS_KIT_ATTRIBUTES:
+                    translations_phase.rows += self._add_translations(
+                        model, gtfs_attribute, translation_index, data_feed
+                    )
+            self.row_counts[self.TRANSLATIONS] = translations_phase.rows
 
+            self.logger.info(f"Import phases:\n{self.profiler.get_report()}")
+            feed.import_profile = self.profiler.as_list()
             feed.imported_at = timezone.now()
+            if self.staging:
+                feed.serving_version = data_feed
             # the feed's name will also get autopopulated here if feed info is available
             feed.save()
 
-        end_time = timer()
-        feed_name = feed.name or "<no name>"
-        self.logger.info(
-            f'Successfully imported GTFS feed "{feed_name}" from "{feed.url_or_path}" '
-            f"in {end_time - start_time:.2f} secs!"
+        self.bytes_written = self._get_wal_bytes_since(wal_position)
+
+    def _create_version(self, feed):
+        self.logger.debug("Creating a new version of the feed...")
+        return Feed.objects.create(
+            name=feed.name,
+            url_or_path=feed.url_or_path,
+            ticketing_system=feed.ticketing_system,
+            version_of=feed,
+        )
+
+    def _check_load_engine(self):
+        if (
+            self.load_engine == self.LOAD_ENGINE_COPY
+            and connection.vendor != "postgresql"
+        ):
+            raise GTFSFeedImporterError(
+                f'Load engine "{self.load_engine}" requires PostgreSQL.'
+            )
+
+    @staticmethod
+    def _get_wal_position():
+        """Return the database's write-ahead log insert position.
+
+        The WAL grows with every write, so the difference of two positions is the
+        amount of data written in between, including concurrent writes of others.
+        """
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_current_wal_insert_lsn()")
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _get_wal_bytes_since(wal_position):
+        if wal_position is None:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)",
+                [wal_position],
+            )
+            return int(cursor.fetchone()[0])
+
+    def _read_table(self, feed_data: GTFSFeedData, table: str):
+        """Yield the table's data, in validated chunks if it is read in chunks."""
+        if not feed_data.path or table not in self.CHUNKED_TABLES:
+            yield getattr(feed_data.gtfs_feed, table)
+            return
+
+        group_column = self.CHUNKED_TABLES[table]
+        previous_groups = set()
+        chunks = self.feed_reader.read_table_chunks(
+            feed_data.path, table, self.chunk_size, group_column
+        )
+        try:
+            for chunk in chunks:
+                groups = set(chunk[group_column].unique())
+                if not groups.isdisjoint(previous_groups):
+                    raise GTFSFeedImporterError(
+                        f"{table}.txt needs to be ordered by {group_column} to be "
+                        f"imported in chunks."
+                    )
+                previous_groups |= groups
+
+                if not feed_data.skip_validation:
+                    self._raise_for_problems(
+                        self.feed_reader.validate_table_chunk(
+                            feed_data.gtfs_feed, table, chunk
+                        )
+                    )
+                yield chunk
+        except (ValueError, TypeError) as e:
+            raise GTFSFeedImporterError(f"Error reading GTFS feed: {str(e)}") from e
+
+    def _count_rows(self, gtfs_feed, skip_tables):
+        tables = set(gtfs_kit.constants.GTFS_REF["table"]) | set(
+            self.feed_reader.EXTRA_FILES
+        )
+        return sum(
+            len(data)
+            for table in tables - set(skip_tables)
+            if (data := getattr(gtfs_feed, table, None)) is not None
         )
 
+    def _raise_for_problems(self, results):
+        if results:
+            if any(r[0] == "error" for r in results):
+                message = f"Validation errors and warnings: {results}"
+                self.logger.error(message)
+                raise GTFSFeedImporterError(message)
+            else:
+                self.logger.debug(f"Validation warnings: {results}")
+
     def _delete_existing_gtfs_objects(self, feed):
-        models_to_delete = [Shape] + [m[0] for m in self.MODELS_AND_GTFS_KIT_ATTRIBUTES]
+        # stop departures are deleted first, as a whole, so that they don't need to
+        # be collected for the cascades
+        models_to_delete = [StopDeparture, Shape] + [
+            m[0] for m in self.MODELS_AND_GTFS_KIT_ATTRIBUTES
+        ]
         for model in models_to_delete:
             self.logger.debug(
                 f"Deleting existing {model._meta.verbose_name_plural}"
@@ -219,109 +510,406 @@ class GTFSFeedImporter:
             )
             model.objects.filter(feed=feed).delete()
 
-    def _import_shapes(self, feed, gtfs_feed):
-        gtfs_data = gtfs_feed.shapes
+    def _delete_removed_gtfs_objects(self):
+        # objects are deleted only after all of the other changes have been saved,
+        # and in reverse order, so that the deletions won't cascade to objects that
+        # now refer to something else
+        models_to_delete = [Shape] + [m[0] for m in self.MODELS_AND_GTFS_KIT_ATTRIBUTES]
+        for model in reversed(models_to_delete):
+            if ids := self.ids_to_delete.get(model):
+                self.logger.debug(
+                    f"Deleting {len(ids)} removed {model._meta.verbose_name_plural}..."
+                )
+                model.objects.filter(id__in=ids).delete()
+
+    def _import_shapes(self, feed, gtfs_data):
+        """Import the shape points as shapes, returns the number of shape points."""
         num_of_rows = len(gtfs_data) if gtfs_data is not None else 0
 
         if num_of_rows:
             self.logger.info(f"Importing {num_of_rows} shape points...")
         else:
             self.logger.info("No shapes.")
-            return
+            if self.incremental:
+                self._sync_objects(feed, Shape, [], ["source_id", "geometry"])
+            return 0
 
-        grouped = gtfs_data.sort_values(by="shape_pt_sequence").groupby("shape_id")
-        num_of_shapes = len(grouped)
+        line_strings = self._build_line_strings(gtfs_data)
+        num_of_shapes = gtfs_data["shape_id"].nunique()
 
-        for num_of_processed, gtfs_row in enumerate(
-            grouped[["shape_pt_lat", "shape_pt_lon"]], 1
-        ):
-            coordinates = gtfs_row[1][["shape_pt_lat", "shape_pt_lon"]]
-            geometry = LineString(
-                [(c.shape_pt_lon, c.shape_pt_lat) for c in coordinates.itertuples()]
+        if self.incremental:
+            rows = (
+                ({"source_id": source_id, "geometry": geometry}, {})
+                for source_id, geometry in line_strings
             )
-            shape = Shape.objects.create(
-                feed=feed, source_id=gtfs_row[0], geometry=geometry
+            self._sync_objects(feed, Shape, rows, ["source_id", "geometry"])
+            return num_of_rows
+
+        if self.load_engine == self.LOAD_ENGINE_COPY:
+            self._copy_shapes(feed, line_strings, num_of_shapes)
+            return num_of_rows
+
+        shapes = (
+            Shape(
+                feed=feed,
+                source_id=source_id,
+                api_id=Shape.build_api_id(feed.api_feed_id, source_id),
+                geometry=geometry,
             )
-            self.id_cache[Shape].update({shape.source_id: shape.id})
-            if (
-                num_of_processed % self.object_creation_batch_size == 0
-                or num_of_processed >= num_of_shapes
-            ):
-                self.logger.debug(
-                    f"Processed {num_of_processed}/{num_of_shapes} shapes"
+            for source_id, geometry in line_strings
+        )
+        num_of_processed = 0
+        while batch := list(islice(shapes, self.object_creation_batch_size)):
+            created_shapes = Shape.objects.bulk_create(batch)
+            self.id_cache[Shape].update({s.source_id: s.id for s in created_shapes})
+            num_of_processed += len(created_shapes)
+            self.logger.debug(f"Processed {num_of_processed}/{num_of_shapes} shapes")
+        return num_of_rows
+
+    def _copy_shapes(self, feed, line_strings, num_of_shapes):
+        fields = [
+            Shape._meta.get_field(name)
+            for name in ("id", "feed", "source_id", "api_id", "geometry")
+        ]
+        ids = self.copy_loader.reserve_ids(Shape, num_of_shapes)
+        source_ids = []
+
+        def rows():
+            for shape_id, (source_id, geometry) in zip(ids, line_strings):
+                source_ids.append(source_id)
+                yield (
+                    shape_id,
+                    feed.id,
+                    source_id,
+                    Shape.build_api_id(feed.api_feed_id, source_id),
+                    geometry,
                 )
 
-    def _import_model(self, feed, model, gtfs_data):  # noqa: C901
+        num_of_copied = self.copy_loader.copy(Shape, fields, rows())
+        self.id_cache[Shape].update(zip(source_ids, ids))
+        self.logger.debug(f"Copied {num_of_copied} shapes")
+
+    @staticmethod
+    def _build_line_strings(gtfs_data):
+        """Yield a (shape_id, LineString) tuple for every shape in the shape points.
+
+        The geometries are created from WKB that is assembled straight from the
+        points' coordinate array, instead of handling every point in Python.
+        """
+        gtfs_data = gtfs_data.sort_values(
+            ["shape_id", "shape_pt_sequence"], kind="mergesort"
+        )
+        shape_ids = gtfs_data["shape_id"].to_numpy()
+        coordinates = gtfs_data[["shape_pt_lon", "shape_pt_lat"]].to_numpy(dtype="<f8")
+        boundaries = [
+            0,
+            *(np.flatnonzero(shape_ids[1:] != shape_ids[:-1]) + 1),
+            len(shape_ids),
+        ]
+
+        for start, end in zip(boundaries, boundaries[1:]):
+            # little-endian WKB: byte order, geometry type, number of points, points
+            header = struct.pack("<BII", 1, WKB_LINESTRING, end - start)
+            yield shape_ids[start], GEOSGeometry(
+                memoryview(header + coordinates[start:end].tobytes())
+            )
+
+    def _import_model(self, feed, model, gtfs_data):
+        """Import the GTFS rows as objects of the model, returns the number of rows."""
         num_of_rows = len(gtfs_data) if gtfs_data is not None else 0
         plural_name = model._meta.verbose_name_plural
 
         if num_of_rows:
             self.logger.info(f"Importing {num_of_rows} {plural_name}...")
+            rows = self._convert_rows(model, gtfs_data)
         else:
             self.logger.info(f"No {plural_name}")
-            return
+            rows = []
 
-        try:
-            translation_model = model.translations.rel.related_model
-        except AttributeError:
-            translation_model = None
+        if self.incremental:
+            self._sync_objects(feed, model, rows, self.FIELD_MAPPING[model])
+        elif num_of_rows:
+            self._insert_objects(feed, model, rows, num_of_rows)
+        return num_of_rows
 
-        objs_to_create = []
-        manually_created = []
-        num_of_skipped = 0
+    def _insert_objects(self, feed, model, rows, num_of_rows):
+        if self.load_engine == self.LOAD_ENGINE_COPY:
+            self._copy_objects(feed, model, rows, num_of_rows)
+        else:
+            self._create_objects(feed, model, rows, num_of_rows)
 
-        # gtfs_kit returns DataFrames and extra dataset uses list
-        iterable_data = (
-            gtfs_data if isinstance(gtfs_data, list) else gtfs_data.itertuples()
+    def _sync_objects(self, feed, model, rows, field_names):
+        """Save only the changes between the rows and the feed's existing objects.
+
+        Objects are matched by their natural key and compared by the values of the
+        imported fields. New objects are inserted and changed ones updated, so the
+        objects that are still in the feed keep their IDs. Objects that are no
+        longer in the feed are collected to self.ids_to_delete.
+        """
+        plural_name = model._meta.verbose_name_plural
+        translation_model = self._get_translation_model(model)
+        translated_fields = (
+            translation_model.get_translated_fields() if translation_model else []
+        )
+        fields = [
+            model._meta.get_field(name)
+            for name in field_names
+            if name not in translated_fields
+        ]
+        translation_fields = [
+            translation_model._meta.get_field(name)
+            for name in field_names
+            if name in translated_fields
+        ]
+        key_indexes = [
+            fields.index(model._meta.get_field(name))
+            for name in self.NATURAL_KEYS.get(model, ("source_id",))
+        ]
+        if translation_model:
+            self.base_languages[model] = self._get_import_language()
+
+        existing_objects = self._get_existing_objects(
+            feed, model, fields, translation_fields, key_indexes
+        )
+
+        rows_to_insert = []
+        objs_to_update = []
+        translations_to_save = []
+        for creation_attributes, translation_attributes in rows:
+            attributes = self._get_attname_values(model, creation_attributes)
+            values = self._get_field_values(fields, attributes)
+            translation_values = self._get_field_values(
+                translation_fields, translation_attributes
+            )
+            key = tuple(values[i] for i in key_indexes)
+
+            if not existing_objects[key]:
+                rows_to_insert.append((creation_attributes, translation_attributes))
+                continue
+
+            pk, existing_values, translation = existing_objects[key].pop()
+            if hasattr(model, "source_id"):
+                self.id_cache[model][attributes["source_id"]] = pk
+
+            if self._get_comparable_values(
+                fields, values
+            ) != self._get_comparable_values(fields, existing_values):
+                objs_to_update.append(
+                    model(
+                        pk=pk,
+                        feed_id=feed.id,
+                        **{f.attname: v for f, v in zip(fields, values)},
+                    )
+                )
+            if translation_fields and (
+                translation := self._get_changed_base_translation(
+                    model, pk, translation, translation_fields, translation_values
+                )
+            ):
+                translations_to_save.append(translation)
+
+        if rows_to_insert:
+            self._insert_objects(feed, model, rows_to_insert, len(rows_to_insert))
+        if objs_to_update:
+            model.objects.bulk_update(
+                objs_to_update,
+                [f.name for f in fields],
+                batch_size=self.object_creation_batch_size,
+            )
+        if translations_to_save:
+            self._save_base_translations(
+                translation_model, translation_fields, translations_to_save
+            )
+        self.ids_to_delete[model] = [
+            pk for objs in existing_objects.values() for pk, _values, _trans in objs
+        ]
+        self.updated_ids[model] = [obj.pk for obj in objs_to_update]
+        self._add_changed_trip_ids(model, rows_to_insert, objs_to_update)
+
+        self.logger.debug(
+            f"Inserted {len(rows_to_insert)}, updated "
+            f"{len(objs_to_update) + len(translations_to_save)} and found "
+            f"{len(self.ids_to_delete[model])} removed {plural_name}"
+        )
+
+    def _add_changed_trip_ids(self, model, inserted_rows, updated_objs):
+        if model is Trip:
+            self.changed_trip_ids.update(obj.pk for obj in updated_objs)
+        elif model is StopTime:
+            self.changed_trip_ids.update(
+                self._get_attname_values(model, creation_attributes)["trip_id"]
+                for creation_attributes, _translation_attributes in inserted_rows
+            )
+            self.changed_trip_ids.update(obj.trip_id for obj in updated_objs)
+
+    def _get_existing_objects(
+        self, feed, model, fields, translation_fields, key_indexes
+    ):
+        """Return the feed's objects of the model grouped by their natural key.
+
+        Returns {key: [(pk, field values, base language translation)]}
+        """
+        translations = {}
+        if translation_fields:
+            translation_model = translation_fields[0].model
+            translations = {
+                translation.master_id: translation
+                for translation in translation_model.objects.filter(
+                    master__feed=feed, language_code=self.base_languages[model]
+                )
+            }
+
+        existing_objects = defaultdict(list)
+        for pk, *values in model.objects.filter(feed=feed).values_list(
+            "pk", *(f.attname for f in fields)
+        ):
+            key = tuple(values[i] for i in key_indexes)
+            existing_objects[key].append((pk, values, translations.get(pk)))
+        return existing_objects
+
+    def _get_changed_base_translation(
+        self, model, pk, translation, translation_fields, translation_values
+    ):
+        """Return the object's base language translation if its values have changed.
+
+        The returned translation has the new values set, None is returned when
+        nothing has changed.
+        """
+        if translation is None:
+            translation = translation_fields[0].model(
+                master_id=pk, language_code=self.base_languages[model]
+            )
+        elif self._get_comparable_values(
+            translation_fields, translation_values
+        ) == self._get_comparable_values(
+            translation_fields,
+            [getattr(translation, f.attname) for f in translation_fields],
+        ):
+            return None
+
+        for field, value in zip(translation_fields, translation_values):
+            setattr(translation, field.attname, value)
+        return translation
+
+    def _save_base_translations(
+        self, translation_model, translation_fields, translations
+    ):
+        translation_model.objects.bulk_create(
+            [t for t in translations if t.pk is None],
+            batch_size=self.object_creation_batch_size,
         )
+        translation_model.objects.bulk_update(
+            [t for t in translations if t.pk is not None],
+            [f.name for f in translation_fields],
+            batch_size=self.object_creation_batch_size,
+        )
+
+    @staticmethod
+    def _get_comparable_values(fields, values):
+        """Normalize field values so that converted and stored values compare equal."""
+        comparable_values = []
+        for field, value in zip(fields, values):
+            if value is None:
+                pass
+            elif isinstance(field, models.GeometryField):
+                value = value.coords
+            else:
+                value = field.to_python(value)
+            comparable_values.append(value)
+        return comparable_values
+
+    def _convert_rows(self, model, gtfs_data):
+        """Convert GTFS rows to model field values.
+
+        The values are converted a whole column at a time using the model's
+        conversion plan. Yields a tuple of (creation attributes, translation
+        attributes) per row.
+        """
+        # gtfs_kit returns DataFrames and extra dataset uses list
+        if isinstance(gtfs_data, list):
+            gtfs_data = pd.DataFrame(gtfs_data)
+
+        conversion_plan = self._get_conversion_plan(model)
+        columns = [
+            conversion.convert(self._get_gtfs_values(gtfs_data, conversion.gtfs_field))
+            for conversion in conversion_plan
+        ]
 
-        for num_of_processed, gtfs_row in enumerate(iterable_data, 1):
+        for values in zip(*columns):
             creation_attributes = {}
             translation_attributes = {}
 
-            # Populate object creation attributes using the mapping from model fields
-            # to GTFS fields. How the values are converted between the two is
-            # determined by the model field's type.
+            for conversion, value in zip(conversion_plan, values):
+                if conversion.translated:
+                    translation_attributes[conversion.model_field_name] = value
+                elif value is not None:
+                    creation_attributes[conversion.model_field_name] = value
+
+            if model == FeedInfo:
+                self.feed_lang = creation_attributes.get("lang")
+
+            yield creation_attributes, translation_attributes
+
+    def _get_conversion_plan(self, model):
+        """Return how the model's fields are converted from GTFS fields.
+
+        Populate object creation attributes using the mapping from model fields to
+        GTFS fields. How the values are converted between the two is determined by
+        the model field's type. The plan is compiled once per model.
+        """
+        if model not in self.conversion_plans:
+            translation_model = self._get_translation_model(model)
+            translated_fields = (
+                translation_model.get_translated_fields() if translation_model else []
+            )
+
+            conversion_plan = []
             for model_field_name, gtfs_field in self.FIELD_MAPPING[model].items():
-                gtfs_value = (
-                    getattr(gtfs_row, gtfs_field, None)
-                    if isinstance(gtfs_field, str)
-                    # when a model field is mapped to multiple GTFS fields build a
-                    # list of their values
-                    else [getattr(gtfs_row, f, None) for f in gtfs_field]
+                translated = model_field_name in translated_fields
+                model_field = (
+                    translation_model if translated else model
+                )._meta.get_field(model_field_name)
+                conversion_plan.append(
+                    FieldConversion(
+                        model_field_name,
+                        gtfs_field,
+                        translated,
+                        self._get_column_converter(model_field, gtfs_field),
+                    )
                 )
+            self.conversion_plans[model] = conversion_plan
 
-                if translation_model and model_field_name in [
-                    f.name for f in translation_model._meta.get_fields()
-                ]:
-                    model_field = translation_model._meta.get_field(model_field_name)
-                    translation_attributes[model_field_name] = self._convert_value(
-                        gtfs_value, model_field, gtfs_field
-                    )
-                else:
-                    model_field = model._meta.get_field(model_field_name)
-                    if (
-                        converted_value := self._convert_value(
-                            gtfs_value, model_field, gtfs_field
-                        )
-                    ) is not None:
-                        creation_attributes[model_field_name] = converted_value
+        return self.conversion_plans[model]
 
-            new_obj = model(feed_id=feed.id, **creation_attributes)
-            if hasattr(model, "populate_api_id"):
-                new_obj.populate_api_id()
+    @classmethod
+    def _get_gtfs_values(cls, gtfs_data, gtfs_field):
+        if not isinstance(gtfs_field, str):
+            # when a model field is mapped to multiple GTFS fields return a
+            # DataFrame of their values
+            return pd.concat(
+                [cls._get_gtfs_values(gtfs_data, f) for f in gtfs_field], axis=1
+            )
+        if gtfs_field not in gtfs_data:
+            return pd.Series(None, index=gtfs_data.index, dtype=object)
+        return gtfs_data[gtfs_field]
 
-            if model == FeedInfo:
-                self.feed_lang = creation_attributes.get("lang")
+    def _create_objects(self, feed, model, rows, num_of_rows):
+        plural_name = model._meta.verbose_name_plural
+        translation_model = self._get_translation_model(model)
 
-            if translation_model is not None:
-                new_obj.set_current_language(self.feed_lang)
-                for key in translation_attributes:
-                    setattr(new_obj, key, translation_attributes[key])
-                new_obj.save()
-                manually_created.append(new_obj)
-            else:
-                objs_to_create.append(new_obj)
+        has_api_id = hasattr(model, "populate_api_id")
+        api_feed_id = feed.api_feed_id
+
+        objs_to_create = []
+        translations_to_create = []
+
+        for num_of_processed, row in enumerate(rows, 1):
+            creation_attributes, translation_attributes = row
+            new_obj = model(feed_id=feed.id, **creation_attributes)
+            if has_api_id:
+                new_obj.populate_api_id(api_feed_id)
+            objs_to_create.append(new_obj)
+            translations_to_create.append(translation_attributes)
 
             if (
                 num_of_processed % self.object_creation_batch_size == 0
@@ -329,85 +917,410 @@ class GTFSFeedImporter:
             ):
                 created_objs = model.objects.bulk_create(objs_to_create)
 
+                # translations need the PKs of the created objects, which
+                # bulk_create() populates on PostgreSQL
+                if translation_model is not None:
+                    self._create_translations(
+                        translation_model, created_objs, translations_to_create
+                    )
+
                 # update ID cache
                 if "source_id" in creation_attributes:
-                    obj_list = created_objs or manually_created
-                    self.id_cache[model].update({o.source_id: o.id for o in obj_list})
+                    self.id_cache[model].update(
+                        {o.source_id: o.id for o in created_objs}
+                    )
 
                 objs_to_create = []
-                manually_created = []
+                translations_to_create = []
 
                 self.logger.debug(
                     f"Processed {num_of_processed}/{num_of_rows} {plural_name}"
                 )
-                if num_of_processed >= num_of_rows and num_of_skipped:
-                    self.logger.info(f"Skipped {num_of_skipped} {plural_name}")
 
-    def _create_departures(self, gtfs_feed):
+    def _create_translations(self, translation_model, objs, translation_attributes):
+        language_code = self._get_import_language()
+        translation_model.objects.bulk_create(
+            translation_model(
+                master_id=obj.pk, language_code=language_code, **attributes
+            )
+            for obj, attributes in zip(objs, translation_attributes)
+            # an object without any translated values doesn't get a translation
+            if attributes
+        )
+
+    def _copy_objects(self, feed, model, rows, num_of_rows):
+        """Stream the rows into the model's table and its translation table.
+
+        Primary keys are reserved beforehand so that the translation rows and the ID
+        cache can be populated without reading the created rows back.
+        """
+        plural_name = model._meta.verbose_name_plural
+        translation_model = self._get_translation_model(model)
+        has_source_id = hasattr(model, "populate_api_id")
+
+        ids = (
+            self.copy_loader.reserve_ids(model, num_of_rows)
+            if translation_model or has_source_id
+            else None
+        )
+        fields = [f for f in model._meta.concrete_fields if not f.primary_key or ids]
+        translation_rows = []
+        source_ids = []
+
+        def values():
+            for index, (creation_attributes, translation_attributes) in enumerate(rows):
+                attributes = self._get_attname_values(model, creation_attributes)
+                attributes["feed_id"] = feed.id
+                if ids:
+                    attributes[model._meta.pk.attname] = ids[index]
+                if has_source_id:
+                    source_id = attributes.get("source_id")
+                    attributes["api_id"] = model.build_api_id(
+                        feed.api_feed_id, source_id
+                    )
+                    source_ids.append(source_id)
+                if translation_model is not None and translation_attributes:
+                    translation_rows.append((ids[index], translation_attributes))
+
+                yield self._get_field_values(fields, attributes)
+
+        num_of_copied = self.copy_loader.copy(model, fields, values())
+
+        if has_source_id:
+            self.id_cache[model].update(zip(source_ids, ids))
+
+        if translation_rows:
+            self._copy_translations(translation_model, translation_rows)
+
+        self.logger.debug(f"Copied {num_of_copied}/{num_of_rows} {plural_name}")
+
+    def _copy_translations(self, translation_model, translation_rows):
+        language_code = self._get_import_language()
+        fields = [
+            f for f in translation_model._meta.concrete_fields if not f.primary_key
+        ]
+
+        def values():
+            for master_id, translation_attributes in translation_rows:
+                attributes = self._get_attname_values(
+                    translation_model, translation_attributes
+                )
+                attributes["master_id"] = master_id
+                attributes["language_code"] = language_code
+                yield self._get_field_values(fields, attributes)
+
+        self.copy_loader.copy(translation_model, fields, values())
+
+    def _get_import_language(self):
+        # the same fallback parler uses when an object's language is set to an empty
+        # value, the feed's language isn't known until feed info has been imported
+        return normalize_language_code(self.feed_lang or get_language())
+
+    @staticmethod
+    def _get_attname_values(model, attributes):
+        return {
+            model._meta.get_field(name).attname: value
+            for name, value in attributes.items()
+        }
+
+    @staticmethod
+    def _get_field_values(fields, attributes):
+        return [
+            attributes[field.attname]
+            if field.attname in attributes
+            else field.get_default()
+            for field in fields
+        ]
+
+    @staticmethod
+    def _get_translation_model(model):
+        try:
+            return model.translations.rel.related_model
+        except AttributeError:
+            return None
+
+    def _create_departures(self, feed, gtfs_feed):
         self.logger.info("Creating departures...")
 
         self.logger.debug("Computing trip activity...")
         dates = gtfs_kit.calendar.get_dates(gtfs_feed)
         trip_activities = gtfs_kit.compute_trip_activity(gtfs_feed, dates)
 
-        num_of_activities = len(trip_activities)
-        objs_to_create = []
-        total_num_of_created = 0
-
-        for index, trip_activity in trip_activities.iterrows():
-            for date_str in trip_activity[trip_activity == 1].index:
-                trip = self.id_cache[Trip][trip_activity["trip_id"]]
-                trip_date = gtfs_kit.datestr_to_date(date_str)
+        trip_dates = self._get_active_trip_dates(trip_activities)
 
-                departure = Departure(trip_id=trip, date=trip_date)
-                departure.populate_api_id()
-                objs_to_create.append(departure)
-
-                if len(objs_to_create) % self.object_creation_batch_size == 0:
-                    Departure.objects.bulk_create(objs_to_create)
-                    total_num_of_created += len(objs_to_create)
-                    objs_to_create = []
+        trip_dates["trip_pk"] = trip_dates["trip_id"].map(self.id_cache[Trip])
+        if trip_dates["trip_pk"].isna().any():
+            missing = trip_dates["trip_id"][trip_dates["trip_pk"].isna()]
+            raise GTFSFeedImporterError(
+                f"Trip activity for unknown trips: {missing.unique().tolist()}"
+            )
+        trip_dates["trip_pk"] = trip_dates["trip_pk"].astype(int)
+
+        if self.incremental:
+            trip_dates = self._sync_departures(feed, trip_dates)
+            self.changed_trip_ids.update(trip_dates["trip_pk"].tolist())
+        num_of_departures = len(trip_dates)
+
+        departure_dates = trip_dates["date"].tolist()
+        departures = zip(
+            Departure.build_api_ids(
+                feed.api_feed_id, trip_dates["trip_id"], departure_dates
+            ),
+            trip_dates["trip_pk"].tolist(),
+            departure_dates,
+        )
 
-            num_of_processed = int(index) + 1
-            if (
-                num_of_processed % self.object_creation_batch_size
-            ) == 0 or num_of_processed >= num_of_activities:
+        if self.load_engine == self.LOAD_ENGINE_COPY:
+            fields = [
+                Departure._meta.get_field(name) for name in ("api_id", "trip", "date")
+            ]
+            self.copy_loader.copy(Departure, fields, departures)
+        else:
+            num_of_created = 0
+            while batch := list(islice(departures, self.departure_creation_batch_size)):
+                Departure.objects.bulk_create(
+                    Departure(api_id=api_id, trip_id=trip_id, date=date)
+                    for api_id, trip_id, date in batch
+                )
+                num_of_created += len(batch)
                 self.logger.debug(
-                    f"Processed {num_of_processed}/{num_of_activities} trips"
+                    f"Processed {num_of_created}/{num_of_departures} departures"
                 )
 
-        total_num_of_created += len(objs_to_create)
-        Departure.objects.bulk_create(objs_to_create)
+        self.logger.debug(f"Created {num_of_departures} departures")
+        return num_of_departures
+
+    def _sync_departures(self, feed, trip_dates):
+        """Delete the feed's departures that are no longer active.
+
+        Returns the trip dates that don't have a departure yet.
+        """
+        existing_departures = pd.DataFrame.from_records(
+            Departure.objects.filter(trip__feed=feed).values_list(
+                "id", "trip_id", "date"
+            ),
+            columns=["id", "trip_pk", "date"],
+        )
+        active_keys = pd.MultiIndex.from_frame(trip_dates[["trip_pk", "date"]])
+        existing_keys = pd.MultiIndex.from_frame(
+            existing_departures[["trip_pk", "date"]]
+        )
+
+        removed = existing_departures["id"][~existing_keys.isin(active_keys)]
+        if ids_to_delete := removed.tolist():
+            self.logger.debug(f"Deleting {len(ids_to_delete)} removed departures...")
+            Departure.objects.filter(id__in=ids_to_delete).delete()
+
+        return trip_dates[~active_keys.isin(existing_keys)]
 
-        self.logger.debug(f"Created {total_num_of_created} departures")
+    @staticmethod
+    def _get_active_trip_dates(trip_activities):
+        """Turn gtfs_kit's trips x dates activity matrix into (trip_id, date) rows."""
+        if trip_activities.empty:
+            return pd.DataFrame({"trip_id": [], "date": []})
+
+        activity = trip_activities.set_index("trip_id").stack()
+        active = activity[activity == 1].index.to_frame(
+            index=False, name=["trip_id", "date"]
+        )
+
+        # there are a lot less distinct dates than departures, so convert each date
+        # string only once
+        date_strs = active["date"].unique()
+        active["date"] = active["date"].map(
+            dict(zip(date_strs, map(gtfs_kit.datestr_to_date, date_strs)))
+        )
+        return active
 
     def _populate_stop_times_last_field(self, feed):
         self.logger.info("Populating stop times stops_after_this field...")
 
-        for trip in feed.trips.all():
-            trip.populate_stop_times_stops_after_this()
+        # A single feed-wide UPDATE, the same as running
+        # Trip.populate_stop_times_stops_after_this() for every trip
+        table = connection.ops.quote_name(StopTime._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} AS stop_time
+                SET stops_after_this = last_stop.stop_sequence - stop_time.stop_sequence
+                FROM (
+                    SELECT trip_id, MAX(stop_sequence) AS stop_sequence
+                    FROM {table}
+                    WHERE feed_id = %(feed_id)s
+                    GROUP BY trip_id
+                ) AS last_stop
+                WHERE stop_time.trip_id = last_stop.trip_id
+                AND stop_time.stops_after_this IS DISTINCT FROM
+                    last_stop.stop_sequence - stop_time.stop_sequence
+                {'RETURNING stop_time.trip_id' if self.incremental else ''}
+                """,
+                {"feed_id": feed.id},
+            )
+            if self.incremental:
+                self.changed_trip_ids.update(trip_id for (trip_id,) in cursor)
+            self.logger.debug(f"Updated {cursor.rowcount} stop times")
+            return cursor.rowcount
+
+    def _populate_route_stops(self, feed):
+        self.logger.info("Populating route stops...")
+
+        # Rebuilt from scratch with a single INSERT ... SELECT, the same as running
+        # Route.populate_route_stops() for every route
+        route_stop_table = connection.ops.quote_name(RouteStop._meta.db_table)
+        stop_time_table = connection.ops.quote_name(StopTime._meta.db_table)
+        trip_table = connection.ops.quote_name(Trip._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {route_stop_table} WHERE feed_id = %(feed_id)s",
+                {"feed_id": feed.id},
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {route_stop_table}
+                    (feed_id, route_id, stop_id, direction_id, first_stop_sequence)
+                SELECT
+                    %(feed_id)s,
+                    trip.route_id,
+                    stop_time.stop_id,
+                    trip.direction_id,
+                    MIN(stop_time.stop_sequence)
+                FROM {stop_time_table} AS stop_time
+                JOIN {trip_table} AS trip ON trip.id = stop_time.trip_id
+                WHERE stop_time.feed_id = %(feed_id)s
+                GROUP BY trip.route_id, stop_time.stop_id, trip.direction_id
+                """,
+                {"feed_id": feed.id},
+            )
+            self.logger.debug(f"Created {cursor.rowcount} route stops")
+            return cursor.rowcount
+
+    def _populate_stop_departures(self, feed):
+        # incremental imports rebuild only the stop departures of the changed trips,
+        # the removed objects' stop departures have been deleted by the cascades
+        if self.incremental and StopDeparture.objects.filter(feed=feed).exists():
+            trip_ids = self._get_changed_trip_ids()
+            self.logger.info(
+                f"Populating stop departures of {len(trip_ids)} changed trips..."
+            )
+            return self.populate_stop_departures(feed, trip_ids)
+
+        self.logger.info("Populating stop departures...")
+        return self.populate_stop_departures(feed)
+
+    def _get_changed_trip_ids(self):
+        trip_ids = set(self.changed_trip_ids)
+        # the times of a route's trips depend on the route's agency's timezone
+        route_ids = self.updated_ids.get(Route, [])
+        agency_ids = self.updated_ids.get(Agency, [])
+        if route_ids or agency_ids:
+            trip_ids.update(
+                Trip.objects.filter(
+                    models.Q(route_id__in=route_ids)
+                    | models.Q(route__agency_id__in=agency_ids)
+                ).values_list("id", flat=True)
+            )
+        return trip_ids
 
-    def _convert_value(self, gtfs_value, model_field, gtfs_field):
+    def populate_stop_departures(self, feed, trip_ids=None):
+        """Rebuild the feed's stop departures, returns the number of created ones.
+
+        Only the stop departures of the given trips are rebuilt when trip_ids is
+        given. A stop departure is created for every stop time of every departure
+        with a single INSERT ... SELECT, and the times are resolved in the agency's
+        timezone by the database.
+        """
+        tables = {
+            model.__name__: connection.ops.quote_name(model._meta.db_table)
+            for model in (Agency, Departure, Route, StopDeparture, StopTime, Trip)
+        }
+        params = {
+            "feed_id": feed.id,
+            "trip_ids": list(trip_ids) if trip_ids is not None else None,
+        }
+        with connection.cursor() as cursor:
+            if trip_ids is None:
+                cursor.execute(
+                    f"DELETE FROM {tables['StopDeparture']} "
+                    "WHERE feed_id = %(feed_id)s",
+                    params,
+                )
+            else:
+                cursor.execute(
+                    f"""
+                    DELETE FROM {tables['StopDeparture']} AS stop_departure
+                    USING {tables['Departure']} AS departure
+                    WHERE stop_departure.departure_id = departure.id
+                    AND departure.trip_id = ANY(%(trip_ids)s)
+                    """,
+                    params,
+                )
+            cursor.execute(
+                f"""
+                INSERT INTO {tables['StopDeparture']} (
+                    feed_id, departure_id, api_id, stop_time_id, stop_id, route_id,
+                    date, direction_id, stops_after_this, arrival_time,
+                    departure_time
+                )
+                SELECT
+                    %(feed_id)s,
+                    departure.id,
+                    departure.api_id,
+                    stop_time.id,
+                    stop_time.stop_id,
+                    trip.route_id,
+                    departure.date,
+                    trip.direction_id,
+                    stop_time.stops_after_this,
+                    (departure.date + stop_time.arrival_time)
+                        AT TIME ZONE agency.timezone,
+                    (departure.date + stop_time.departure_time)
+                        AT TIME ZONE agency.timezone
+                FROM {tables['Departure']} AS departure
+                JOIN {tables['Trip']} AS trip ON trip.id = departure.trip_id
+                JOIN {tables['StopTime']} AS stop_time
+                    ON stop_time.trip_id = trip.id
+                JOIN {tables['Route']} AS route ON route.id = trip.route_id
+                JOIN {tables['Agency']} AS agency ON agency.id = route.agency_id
+                WHERE trip.feed_id = %(feed_id)s
+                {'AND trip.id = ANY(%(trip_ids)s)' if trip_ids is not None else ''}
+                """,
+                params,
+            )
+            self.logger.debug(f"Created {cursor.rowcount} stop departures")
+            return cursor.rowcount
+
+    def _get_column_converter(self, model_field, gtfs_field):
         if isinstance(model_field, models.ForeignKey):
-            value = self._get_related_obj_id(model_field.related_model, gtfs_value)
             # empty agency_id should default to the only agency there (hopefully) is
             # in the feed
-            if gtfs_field == "agency_id" and not value:
-                value = self._get_default_agency_id()
-            return value
+            return partial(
+                self._convert_foreign_key_column,
+                model_field.related_model,
+                use_default_agency=gtfs_field == "agency_id",
+            )
         elif isinstance(model_field, models.DateField):
-            return self._convert_date(gtfs_value)
+            return self._convert_date_column
         elif isinstance(model_field, models.PointField):
-            return self._convert_point(gtfs_value)
+            return self._convert_point_column
         elif isinstance(model_field, models.IntegerField):
-            return self._convert_int(gtfs_value)
+            return self._convert_int_column
         elif isinstance(model_field, models.CharField) or isinstance(
             model_field, models.TextField
         ):
-            return self._convert_str(gtfs_value)
+            return self._convert_str_column
         else:
             # no conversion needed
-            return gtfs_value
+            return self._convert_column
+
+    def _convert_foreign_key_column(
+        self, related_model, gtfs_values, use_default_agency=False
+    ):
+        id_cache = self.id_cache[related_model]
+        values = [id_cache.get(source_id) for source_id in gtfs_values.tolist()]
+        if use_default_agency and not all(values):
+            default_agency_id = self._get_default_agency_id()
+            values = [value or default_agency_id for value in values]
+        return values
 
     def _get_related_obj_id(self, related_model, source_id):
         return self.id_cache[related_model].get(source_id)
@@ -421,100 +1334,255 @@ class GTFSFeedImporter:
             )
         return next(iter(agency_ids))
 
-    def _form_translation_list(self, gtfs_data):
-        iterable_data = (
-            gtfs_data if isinstance(gtfs_data, list) else gtfs_data.itertuples()
-        )
-        translations_list = []
-        for _num_of_processed, gtfs_row in enumerate(iterable_data, 1):
-            translation_fields = {}
+    def _form_translation_index(self, gtfs_data):
+        """Index the translations by table, record, language and field.
+
+        The index is built in a single pass so that the translations of a model can
+        be looked up without scanning all of the feed's translations again:
+        {table_name: {(record_id, record_sub_id): {language: {field: translation}}}}
+        """
+        translation_index = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
+        if gtfs_data is None:
+            return translation_index
+
+        if isinstance(gtfs_data, list):
+            gtfs_data = pd.DataFrame(gtfs_data)
+        columns = [
+            self._convert_str_column(self._get_gtfs_values(gtfs_data, gtfs_field))
+            for gtfs_field in self.TRANSLATION_MAPPING
+        ]
+        for (
+            table_name,
+            field_name,
+            language,
+            translation,
+            record_id,
+            record_sub_id,
+        ) in zip(*columns):
+            language = normalize_language_code(language or get_language())
+            translation_index[table_name][(record_id, record_sub_id)][language][
+                field_name
+            ] = translation
+
+        return translation_index
+
+    def _add_translations(self, model, gtfs_name, translation_index, feed):
+        """Add the model's translations, returns the number of added translations."""
+        translation_model = self._get_translation_model(model)
+        if translation_model is None:
+            return 0
 
-            for gtfs_field in self.TRANSLATION_MAPPING:
-                gtfs_value = getattr(gtfs_row, gtfs_field, None)
-                translation_fields[gtfs_field] = self._convert_str(gtfs_value)
-            translations_list.append(translation_fields)
+        plural_name = model._meta.verbose_name_plural
+        translated_fields = translation_model.get_translated_fields()
+        field_mapping = {
+            gtfs_field: model_field
+            for model_field, gtfs_field in self.FIELD_MAPPING[model].items()
+            if model_field in translated_fields
+        }
+
+        # {(record key, language): {model field: translation}}
+        grouped_translations = {}
+        for record, languages in translation_index.get(gtfs_name, {}).items():
+            key = self._get_translation_record_key(model, record)
+            for language, translations in languages.items():
+                if translated_values := {
+                    field_mapping[field_name]: translation
+                    for field_name, translation in translations.items()
+                    if field_name in field_mapping
+                }:
+                    grouped_translations[(key, language)] = translated_values
+
+        translated_records = set()
+        if grouped_translations:
+            self.logger.info(
+                f"Adding {len(grouped_translations)} translations for {plural_name}..."
+            )
 
-        return translations_list
+            record_ids = self._get_translation_record_ids(
+                model, feed, {key for key, _language in grouped_translations}
+            )
+            self._save_translations(translation_model, grouped_translations, record_ids)
+            translated_records = {
+                (record_ids[key], language) for key, language in grouped_translations
+            }
+
+        if self.incremental:
+            self._delete_removed_translations(
+                translation_model, feed, self.base_languages[model], translated_records
+            )
+        return len(grouped_translations)
 
-    def _initialize_translation(self, instance, lang: str) -> None:
-        """Initialize translation object with values from the default lang.
+    def _delete_removed_translations(
+        self, translation_model, feed, base_language, translated_records
+    ):
+        """Delete translations that are no longer in the feed.
 
-        This allows a model to have a value for an untranslated fields since parler
-        doesn't use fallback if a translation object exists.
+        The translations in the base language are created along with the objects,
+        so those are kept.
         """
-        if self.feed_lang == lang:
-            return
-
-        model = instance._meta.model
-        translation_model = model.translations.rel.related_model
-        translation_fields = [f.name for f in translation_model._meta.get_fields()]
+        ids_to_delete = [
+            pk
+            for pk, master_id, language in translation_model.objects.filter(
+                master__feed=feed
+            )
+            .exclude(language_code=base_language)
+            .values_list("id", "master_id", "language_code")
+            if (master_id, language) not in translated_records
+        ]
+        if ids_to_delete:
+            self.logger.debug(f"Deleting {len(ids_to_delete)} removed translations...")
+            translation_model.objects.filter(id__in=ids_to_delete).delete()
 
-        with switch_language(instance, self.feed_lang):
-            init_values = {}
+    @staticmethod
+    def _get_translation_record_key(model, record):
+        record_id, record_sub_id = record
+        if model is StopTime:
+            # stop times don't have an ID of their own, they are identified by
+            # trip_id (record_id) and stop_sequence (record_sub_id)
+            try:
+                return record_id, int(record_sub_id)
+            except ValueError:
+                return record_id, None
+        return record_id
+
+    def _get_translation_record_ids(self, model, feed, keys):
+        """Return a mapping from translation record keys to object IDs.
+
+        Raises GTFSFeedImporterError if any of the records does not exist.
+        """
+        if model is StopTime:
+            trip_ids = {
+                source_id: self._get_related_obj_id(Trip, source_id)
+                for source_id in {trip_source_id for trip_source_id, _seq in keys}
+            }
+            trip_source_ids = {pk: source_id for source_id, pk in trip_ids.items()}
+            record_ids = {
+                (trip_source_ids[trip_id], stop_sequence): pk
+                for pk, trip_id, stop_sequence in StopTime.objects.filter(
+                    feed=feed, trip_id__in=[pk for pk in trip_ids.values() if pk]
+                ).values_list("id", "trip_id", "stop_sequence")
+            }
+        else:
+            record_ids = dict(
+                model.objects.filter(feed=feed, source_id__in=keys).values_list(
+                    "source_id", "id"
+                )
+            )
 
-            for model_field_name in self.FIELD_MAPPING[model]:
-                if model_field_name in translation_fields:
-                    if value := getattr(instance, model_field_name):
-                        init_values[model_field_name] = value
+        if missing := keys - record_ids.keys():
+            raise GTFSFeedImporterError(
+                f"Translations refer to nonexistent {model._meta.verbose_name} "
+                f"records: {sorted(missing, key=str)}"
+            )
+        return {key: record_ids[key] for key in keys}
 
-        if init_values:
-            with switch_language(instance, lang):
-                for key in init_values:
-                    setattr(instance, key, init_values[key])
-                instance.save()
+    def _save_translations(self, translation_model, grouped_translations, record_ids):
+        """Create and update translation rows for the grouped translations.
 
-    def _add_translations(self, model, gtfs_name, translations_list, feed):
-        plural_name = model._meta.verbose_name_plural
-        translations_for_model = [
-            t for t in translations_list if t.get("table_name") == gtfs_name
+        A new translation row is initialized with the values of the feed's language
+        first. This allows a model to have a value for an untranslated fields since
+        parler doesn't use fallback if a translation object exists.
+        """
+        existing_translations = {
+            (t.master_id, t.language_code): t
+            for t in translation_model.objects.filter(master_id__in=record_ids.values())
+        }
+        feed_lang = normalize_language_code(self.feed_lang or get_language())
+        fallback_languages = [
+            feed_lang,
+            *appsettings.PARLER_LANGUAGES.get_fallback_languages(feed_lang),
         ]
-        num_of_translations = len(translations_for_model)
+        translated_fields = translation_model.get_translated_fields()
+
+        translations_to_create = []
+        translations_to_update = []
+        for (key, language), translated_values in grouped_translations.items():
+            master_id = record_ids[key]
+            translation = existing_translations.get((master_id, language))
+            if translation is None:
+                translation = translation_model(
+                    master_id=master_id, language_code=language
+                )
+                translations_to_create.append(translation)
+                original_values = None
+            else:
+                original_values = [getattr(translation, f) for f in translated_fields]
+
+            if language != feed_lang:
+                # start over from the feed language's values also when updating, as
+                # they might have changed since the translation was created
+                for field_name in translated_fields:
+                    setattr(
+                        translation,
+                        field_name,
+                        translation_model._meta.get_field(field_name).get_default(),
+                    )
+                self._initialize_translation(
+                    translation,
+                    existing_translations,
+                    fallback_languages,
+                    translated_fields,
+                )
+            for model_field, value in translated_values.items():
+                setattr(translation, model_field, value)
 
-        if num_of_translations == 0:
-            return
+            if original_values is not None and original_values != [
+                getattr(translation, f) for f in translated_fields
+            ]:
+                translations_to_update.append(translation)
 
-        self.logger.info(
-            f"Adding {num_of_translations} translations for {plural_name}..."
+        translation_model.objects.bulk_create(
+            translations_to_create, batch_size=self.object_creation_batch_size
         )
+        if translations_to_update:
+            translation_model.objects.bulk_update(
+                translations_to_update,
+                translated_fields,
+                batch_size=self.object_creation_batch_size,
+            )
 
-        obj_list = model.objects.filter(feed=feed)
-
-        model_fields = [*self.FIELD_MAPPING[model]]
-        gtfs_fields = [*self.FIELD_MAPPING[model].values()]
+    @staticmethod
+    def _initialize_translation(
+        translation, existing_translations, fallback_languages, translated_fields
+    ):
+        """Initialize translation object with values from the feed's language."""
+        for language in fallback_languages:
+            if source := existing_translations.get((translation.master_id, language)):
+                for field_name in translated_fields:
+                    if value := getattr(source, field_name):
+                        setattr(translation, field_name, value)
+                return
 
-        for trans in translations_for_model:
-            obj = obj_list.get(source_id=trans.get("record_id"))
-            field_name = trans.get("field_name", "")
-            if field_name in gtfs_fields:
-                if not obj.has_translation(language_code=trans.get("language")):
-                    self._initialize_translation(obj, trans.get("language"))
-                index = gtfs_fields.index(field_name)
-                model_field = model_fields[index]
-                obj.set_current_language(trans.get("language"))
-                setattr(obj, model_field, trans.get("translation"))
-                obj.save()
+    @staticmethod
+    def _convert_column(gtfs_values):
+        return gtfs_values.tolist()
 
     @staticmethod
-    def _convert_date(gtfs_value):
-        return datetime.strptime(gtfs_value, "%Y%m%d").date() if gtfs_value else None
+    def _convert_date_column(gtfs_values):
+        dates = pd.to_datetime(
+            gtfs_values.mask(gtfs_values == ""), format="%Y%m%d"
+        ).dt.date
+        return dates.where(dates.notna(), None).tolist()
 
     @staticmethod
-    def _convert_point(gtfs_value):
-        return Point(gtfs_value[1], gtfs_value[0])
+    def _convert_point_column(gtfs_values):
+        return [
+            Point(lon, lat)
+            for lat, lon in zip(
+                gtfs_values.iloc[:, 0].tolist(), gtfs_values.iloc[:, 1].tolist()
+            )
+        ]
 
     @staticmethod
-    def _convert_int(gtfs_value):
-        try:
-            # if there are any empty values in the current column all of the column's
-            # values have been converted to floats, hence the round()
-            return round(gtfs_value)
-        except (ValueError, TypeError):  # nan, None
-            return None
+    def _convert_int_column(gtfs_values):
+        if not is_integer_dtype(gtfs_values):
+            # the data hasn't been read with the GTFS dtypes, e.g. an extra dataset
+            gtfs_values = pd.to_numeric(gtfs_values, errors="coerce").round()
+        values = gtfs_values.astype("Int64").astype(object)
+        return values.where(values.notna(), None).tolist()
 
     @staticmethod
-    def _convert_str(gtfs_value):
-        try:
-            if isnan(gtfs_value):
-                return ""
-        except TypeError:
-            return gtfs_value or ""
+    def _convert_str_column(gtfs_values):
+        # categories and nullable strings need to be objects to be filled with ""
+        values = gtfs_values.astype(object)
+        return values.where(values.notna(), "").tolist()
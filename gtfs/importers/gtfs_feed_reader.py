@@ -1,14 +1,23 @@
 import csv
 import hashlib
-import shutil
+import io
 import tempfile
+import zipfile
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from http import HTTPStatus
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import gtfs_kit
+import numpy as np
+import pandas as pd
 import requests
+from django.utils import translation
 from django.utils.timezone import localdate
+from pandas.api.types import is_extension_array_dtype, is_integer_dtype
 from requests import RequestException
 from rest_framework import serializers
 
@@ -34,6 +43,228 @@ class TranslationSerializer(serializers.Serializer):
     language = serializers.CharField()
     translation = serializers.CharField()
     record_id = serializers.CharField()
+    record_sub_id = serializers.CharField(required=False, allow_blank=True)
+
+
+# a decimal number without an exponent, the integer and fractional parts captured
+SIMPLE_DECIMAL_RE = r"^[+-]?(\d*)(?:\.(\d*))?$"
+SURROGATE_CHARACTERS_RE = "[\ud800-\udfff]"
+
+
+def validate_extra_dataset(
+    dataset_file: str, serializer_class, dataset: List, language: Optional[str] = None
+) -> List:
+    """Validate the rows of an extra dataset with the serializer.
+
+    The columns are checked with vectorized checks first, and only the rows that may
+    be invalid are validated with the serializer. This gives the same problems as
+    validating every row with the serializer, but a lot faster.
+    """
+    # the active language is thread local, and this is run in worker threads
+    with translation.override(language or translation.get_language()):
+        df = pd.DataFrame(dataset)
+        maybe_invalid = np.zeros(len(df), dtype=bool)
+        for field_name, field in serializer_class().fields.items():
+            values = df[field_name] if field_name in df else None
+            maybe_invalid |= get_maybe_invalid_values(field, values, len(df))
+
+        problems = []
+        for row_index in np.flatnonzero(maybe_invalid):
+            validator = serializer_class(data=dataset[row_index]._asdict())
+            if not validator.is_valid():
+                problems.append(
+                    ["error", validator.errors, dataset_file, int(row_index) + 1]
+                )
+
+    return problems
+
+
+def get_maybe_invalid_values(
+    field: serializers.Field, values: Optional[pd.Series], length: int
+) -> np.ndarray:
+    """Return a mask of the values that may not pass the field's validation.
+
+    Values outside the mask are valid for sure, the ones in it need to be validated
+    with the field itself. Unsupported field types mark all values.
+    """
+    if values is None:
+        return np.full(length, field.required)
+
+    if values.dtype != object:
+        # not strings read from a file
+        return np.ones(length, dtype=bool)
+    if isinstance(field, serializers.CharField):
+        mask = _get_maybe_invalid_strings(field, values)
+    elif (
+        isinstance(field, serializers.DecimalField)
+        and not field.localize
+        and field.max_value is None
+        and field.min_value is None
+    ):
+        mask = _get_maybe_invalid_decimals(field, values)
+    else:
+        return np.ones(length, dtype=bool)
+
+    return mask.fillna(True).to_numpy(dtype=bool)
+
+
+def _get_maybe_invalid_strings(
+    field: serializers.CharField, values: pd.Series
+) -> pd.Series:
+    stripped = values.str.strip() if field.trim_whitespace else values
+    lengths = stripped.str.len()
+    mask = (
+        values.isna()
+        | values.str.contains("\x00", regex=False)
+        | values.str.contains(SURROGATE_CHARACTERS_RE)
+    )
+    if not field.allow_blank:
+        mask |= stripped == ""
+    if field.max_length is not None:
+        mask |= lengths > field.max_length
+    if field.min_length is not None:
+        mask |= lengths < field.min_length
+    return mask
+
+
+def _get_maybe_invalid_decimals(
+    field: serializers.DecimalField, values: pd.Series
+) -> pd.Series:
+    stripped = values.str.strip()
+    parts = stripped.str.extract(SIMPLE_DECIMAL_RE)
+    digits = parts[0].fillna("") + parts[1].fillna("")
+    # the digits and exponent of the Decimal as in DecimalField.validate_precision()
+    decimal_places = parts[1].fillna("").str.len()
+    total_digits = np.maximum(
+        digits.str.lstrip("0").str.len().clip(lower=1), decimal_places
+    )
+    whole_digits = total_digits - decimal_places
+
+    mask = (
+        parts[0].isna()
+        | (digits == "")
+        | (stripped.str.len() > field.MAX_STRING_LENGTH)
+    )
+    if field.max_digits is not None:
+        mask |= total_digits > field.max_digits
+    if field.decimal_places is not None:
+        mask |= decimal_places > field.decimal_places
+    if field.max_whole_digits is not None:
+        mask |= whole_digits > field.max_whole_digits
+    return mask
+
+
+@lru_cache(maxsize=None)
+def get_extra_row_class(dataset_file: str, headers: Tuple[str, ...]):
+    """Return a namedtuple class for the rows of an extra dataset file.
+
+    The classes are created dynamically, so their rows are pickled by value to make
+    it possible to pass read feeds between processes.
+    """
+    row_class = namedtuple(dataset_file, headers)
+    row_class.__reduce__ = lambda row: (
+        make_extra_row,
+        (dataset_file, row._fields, tuple(row)),
+    )
+    return row_class
+
+
+def make_extra_row(dataset_file: str, headers: Tuple[str, ...], values: Tuple):
+    return get_extra_row_class(dataset_file, headers)._make(values)
+
+
+def get_string_dtype():
+    """Return pyarrow backed strings if they are available, else Python strings."""
+    try:
+        return pd.StringDtype("pyarrow")
+    except (ImportError, TypeError):  # no pyarrow or pandas < 1.3
+        return str
+
+
+STRING = get_string_dtype()
+CATEGORY = "category"
+INT = "Int64"
+FLOAT = "float64"
+
+# dtypes of the GTFS columns that are imported, other columns get gtfs_kit's dtypes.
+# IDs that repeat a lot are categories, and integer columns are nullable so that
+# missing values don't turn them into floats. The integer columns are read as floats
+# and rounded, since non-integral values can't be read as integers.
+GTFS_TABLE_DTYPES = {
+    "agency": {
+        "agency_id": STRING,
+        "agency_name": STRING,
+        "agency_url": STRING,
+        "agency_timezone": STRING,
+        "agency_logo_url": STRING,
+    },
+    "routes": {
+        "route_id": STRING,
+        "agency_id": CATEGORY,
+        "route_short_name": STRING,
+        "route_long_name": STRING,
+        "route_desc": STRING,
+        "route_type": INT,
+        "route_sort_order": INT,
+        "capacity_sales": INT,
+    },
+    "trips": {
+        "route_id": CATEGORY,
+        "direction_id": INT,
+        "wheelchair_accessible": INT,
+        "bikes_allowed": INT,
+        "shape_id": CATEGORY,
+        "block_id": STRING,
+    },
+    "stops": {
+        "stop_id": STRING,
+        "stop_name": STRING,
+        "stop_desc": STRING,
+        "tts_stop_name": STRING,
+        "stop_lat": FLOAT,
+        "stop_lon": FLOAT,
+        "wheelchair_boarding": INT,
+    },
+    "stop_times": {
+        "trip_id": CATEGORY,
+        "stop_id": CATEGORY,
+        "stop_sequence": INT,
+        "stop_headsign": STRING,
+        "timepoint": INT,
+    },
+    "fare_attributes": {
+        "fare_id": STRING,
+        "agency_id": CATEGORY,
+        "price": FLOAT,
+        "currency_type": CATEGORY,
+        "payment_method": INT,
+        "transfers": INT,
+        "fare_name": STRING,
+        "fare_description": STRING,
+        "fare_instructions": STRING,
+    },
+    "fare_rules": {
+        "fare_id": CATEGORY,
+        "route_id": CATEGORY,
+    },
+    "shapes": {
+        "shape_id": CATEGORY,
+        "shape_pt_lat": FLOAT,
+        "shape_pt_lon": FLOAT,
+        "shape_pt_sequence": INT,
+    },
+}
+
+
+class FeedDownload(NamedTuple):
+    path: Path
+    sha1: str
+    etag: str
+    last_modified: str
+    # the server reported that the feed hasn't been modified
+    not_modified: bool = False
+    # the file is kept in the cache directory instead of being deleted in cleanup()
+    cached: bool = False
 
 
 class GTFSFeedReader:
@@ -44,91 +275,449 @@ class GTFSFeedReader:
         "translations": TranslationSerializer,
     }
 
-    def read_feed(self, url_or_filename):
-        feed = gtfs_kit.read_feed(url_or_filename, dist_units="km")
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # columns of the tables that can be read in chunks that other tables refer to
+    REFERENCED_ID_COLUMNS = {
+        "stop_times": ["trip_id", "stop_id"],
+        "shapes": ["shape_id"],
+    }
+    ID_CHUNK_SIZE = 1000000
+    # tables checked by gtfs_kit.validate()
+    GTFS_KIT_CHECKED_TABLES = (
+        "agency",
+        "calendar",
+        "calendar_dates",
+        "fare_attributes",
+        "fare_rules",
+        "feed_info",
+        "frequencies",
+        "routes",
+        "shapes",
+        "stops",
+        "stop_times",
+        "transfers",
+        "trips",
+    )
+
+    def __init__(self, cache_dir: Optional[Union[Path, str]] = None):
+        # feeds downloaded from URLs by URL, so that reading the feed and
+        # fingerprinting it can share a single download
+        self.downloads = {}
+        # the ETag and Last-Modified of the latest responses by URL, also when the
+        # feed wasn't transferred
+        self.validators = {}
+        # when set, the last downloaded archive of every feed is kept here
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def read_feed(self, url_or_filename, skip_tables: Iterable[str] = ()):
+        """Read the feed.
+
+        The tables in skip_tables are not read, they can be read in chunks later with
+        read_table_chunks() instead. Only the IDs other tables refer to are read from
+        them, so that the references can still be validated.
+        """
+        path = self.get_local_path(url_or_filename)
+        feed = self._read_gtfs_tables(path, skip_tables)
+        for table in skip_tables:
+            setattr(feed, table, self._read_table_ids(path, table))
 
-        extra_data = self._read_feed_extra(url_or_filename)
+        extra_data = self._read_feed_extra_from_path(path)
         for key, value in extra_data.items():
             setattr(feed, key, value)
 
         return feed
 
-    def validate(self, gtfs_feed) -> List:
-        problems = gtfs_kit.validate(gtfs_feed, as_df=False)
+    def read_table_chunks(
+        self, path: Union[Path, str], table: str, chunk_size: int, group_column: str
+    ) -> Iterator[pd.DataFrame]:
+        """Read a GTFS table in chunks of about chunk_size rows.
 
-        for dataset_file, serializer in self.EXTRA_FILES.items():
-            if dataset := getattr(gtfs_feed, dataset_file, None):
-                for row_index, row_data in enumerate(dataset, 1):
-                    validator = serializer(data=row_data._asdict())
-                    if not validator.is_valid():
-                        problems.append(
-                            ["error", validator.errors, dataset_file, row_index]
-                        )
+        The rows of a group, for example the stop times of a trip, are never split
+        between chunks when the table is ordered by the group column. A chunk grows
+        over chunk_size rows when a group is bigger than that.
+        """
+        with self._open_feed_files(path) as feed_files:
+            if table not in feed_files:
+                return
+            with feed_files[table]() as f:
+                remainder = None
+                for chunk in pd.read_csv(
+                    f,
+                    dtype=self._get_dtypes(table),
+                    encoding="utf-8-sig",
+                    chunksize=chunk_size,
+                ):
+                    chunk = self._convert_int_columns(
+                        gtfs_kit.clean_column_names(chunk), table
+                    )
+                    if remainder is not None:
+                        chunk = pd.concat([remainder, chunk], ignore_index=True)
 
-        return problems
+                    # hold back the last group, it may continue in the next chunk
+                    groups = chunk[group_column].to_numpy()
+                    last_group_start = len(groups) - np.argmax(
+                        groups[::-1] != groups[-1]
+                    )
+                    if last_group_start == len(groups):
+                        # the whole chunk is a single group
+                        last_group_start = 0
+                    if last_group_start:
+                        yield chunk.iloc[:last_group_start]
+                    remainder = chunk.iloc[last_group_start:]
 
-    def _read_feed_extra(self, path_or_url: Union[Path, str]):
-        """Read GTFS extra data
+                if remainder is not None and not remainder.empty:
+                    yield remainder
 
-        This helper will read defined extra data from files which are ignored
-        by gtfs_kit.
-        """
+    def get_local_path(self, url_or_path: Union[Path, str]) -> Path:
+        """Return a local path of the feed, downloading the feed if needed."""
         try:
-            path_exists = Path(path_or_url).exists()
+            path_exists = Path(url_or_path).exists()
         except OSError:
             path_exists = False
         if path_exists:
-            return self._read_feed_extra_from_path(path_or_url)
-        elif requests.head(path_or_url).ok:
-            return self._read_feed_extra_from_url(path_or_url)
-        else:
-            raise ValueError("Path does not exist or URL has bad status.")
+            return Path(url_or_path)
+
+        try:
+            return self.download(url_or_path).path
+        except RequestException as e:
+            raise ValueError("Path does not exist or URL has bad status.") from e
+
+    def download(
+        self, url: str, etag: str = "", last_modified: str = "", fingerprint: str = ""
+    ) -> Optional[FeedDownload]:
+        """Download the feed from the URL, unless it has already been downloaded.
+
+        When the ETag or Last-Modified of the previously imported feed is given, the
+        request is conditional. If the feed hasn't been modified, the cached copy of
+        the feed is returned without transferring the feed again, or None if there
+        is no cached copy.
+
+        Feeds imported before their ETag and Last-Modified were stored have only a
+        fingerprint, which is compared to the Last-Modified of the response instead.
+        """
+        if url in self.downloads:
+            return self.downloads[url]
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        with requests.get(url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            self.validators[url] = (
+                response.headers.get("etag") or etag,
+                response.headers.get("last-modified") or last_modified,
+            )
+            if self._is_not_modified(response, etag, last_modified, fingerprint):
+                download = self._get_cached_download(url, *self.validators[url])
+            else:
+                download = self._save_download(url, response)
+
+        if download:
+            self.downloads[url] = download
+        return download
+
+    @staticmethod
+    def _is_not_modified(
+        response, etag: str, last_modified: str, fingerprint: str
+    ) -> bool:
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return True
+        # not all servers support conditional requests, so compare the headers too
+        # before transferring the feed
+        if etag or last_modified:
+            return bool(
+                (etag and response.headers.get("etag") == etag)
+                or (
+                    last_modified
+                    and response.headers.get("last-modified") == last_modified
+                )
+            )
+        return (
+            bool(fingerprint) and response.headers.get("last-modified") == fingerprint
+        )
+
+    def _save_download(self, url: str, response) -> FeedDownload:
+        """Stream the response to a file computing its sha1 hash on the way.
+
+        The file is put to the cache directory, or to a temporary file that is
+        deleted in cleanup() when there is no cache directory.
+        """
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        sha1 = hashlib.sha1()
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".zip", delete=False
+        ) as f:
+            path = Path(f.name)
+            try:
+                for chunk in response.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                    sha1.update(chunk)
+                    f.write(chunk)
+            except RequestException:
+                path.unlink()
+                raise
+
+        if cache_path := self._get_cache_path(url):
+            # replace the previous archive only after a complete download
+            path = path.replace(cache_path)
+
+        return FeedDownload(
+            path,
+            sha1.hexdigest(),
+            response.headers.get("etag", ""),
+            response.headers.get("last-modified", ""),
+            cached=bool(cache_path),
+        )
+
+    def _get_cached_download(
+        self, url: str, etag: str, last_modified: str
+    ) -> Optional[FeedDownload]:
+        cache_path = self._get_cache_path(url)
+        if not cache_path or not cache_path.exists():
+            return None
+
+        sha1 = hashlib.sha1()
+        with open(cache_path, "rb") as f:
+            while chunk := f.read(self.DOWNLOAD_CHUNK_SIZE):
+                sha1.update(chunk)
+
+        return FeedDownload(
+            cache_path,
+            sha1.hexdigest(),
+            etag,
+            last_modified,
+            not_modified=True,
+            cached=True,
+        )
+
+    def _get_cache_path(self, url: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.zip"
+
+    def cleanup(self):
+        """Delete the downloaded feeds that aren't cached."""
+        for download in self.downloads.values():
+            if not download.cached:
+                download.path.unlink(missing_ok=True)
+        self.downloads.clear()
+        self.validators.clear()
+
+    def validate(self, gtfs_feed, skip_tables: Iterable[str] = ()) -> List:
+        """Validate the feed.
+
+        Problems in skip_tables are left out, use validate_table_chunk() for the
+        chunks of those.
+        """
+        with ThreadPoolExecutor(len(self.EXTRA_FILES)) as executor:
+            # the extra datasets are validated while gtfs_kit checks the rest
+            extra_futures = [
+                executor.submit(
+                    validate_extra_dataset,
+                    dataset_file,
+                    serializer,
+                    dataset,
+                    translation.get_language(),
+                )
+                for dataset_file, serializer in self.EXTRA_FILES.items()
+                if (dataset := getattr(gtfs_feed, dataset_file, None))
+            ]
+
+            numpy_tables = {
+                table: self._to_numpy_dtypes(getattr(gtfs_feed, table))
+                for table in GTFS_TABLE_DTYPES
+            }
+            with self._replace_tables(gtfs_feed, numpy_tables):
+                if skip_tables:
+                    problems = self._validate_gtfs_tables(gtfs_feed, skip_tables)
+                else:
+                    problems = gtfs_kit.validate(gtfs_feed, as_df=False)
+
+            for future in extra_futures:
+                problems.extend(future.result())
+
+        return problems
+
+    def _validate_gtfs_tables(self, gtfs_feed, skip_tables: Iterable[str]) -> List:
+        """Do the same checks as gtfs_kit.validate() without the skipped tables."""
+        problems = []
+        for table in self.GTFS_KIT_CHECKED_TABLES:
+            if table not in skip_tables:
+                checker = getattr(gtfs_kit.validators, f"check_{table}")
+                problems.extend(checker(gtfs_feed, include_warnings=True))
+
+        if gtfs_feed.calendar is None and gtfs_feed.calendar_dates is None:
+            problems.append(
+                ["error", "Missing both tables", "calendar & calendar_dates", []]
+            )
+
+        return problems
+
+    def validate_table_chunk(self, gtfs_feed, table: str, chunk: pd.DataFrame) -> List:
+        """Validate a chunk of a table that was skipped when reading the feed."""
+        checker = getattr(gtfs_kit.validators, f"check_{table}")
+        with self._replace_tables(gtfs_feed, {table: self._to_numpy_dtypes(chunk)}):
+            return checker(gtfs_feed, as_df=False)
+
+    @staticmethod
+    @contextmanager
+    def _replace_tables(gtfs_feed, tables: Dict[str, Optional[pd.DataFrame]]):
+        """Temporarily replace the given tables of the feed."""
+        original_tables = {table: getattr(gtfs_feed, table) for table in tables}
+        try:
+            for table, df in tables.items():
+                setattr(gtfs_feed, table, df)
+            yield gtfs_feed
+        finally:
+            for table, df in original_tables.items():
+                setattr(gtfs_feed, table, df)
+
+    @staticmethod
+    def _to_numpy_dtypes(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Convert columns with pandas extension dtypes to NumPy dtypes.
+
+        gtfs_kit's checks expect missing values to be NaNs, pd.NA isn't usable in
+        boolean context.
+        """
+        if df is None:
+            return None
+
+        converted = {}
+        for column, values in df.items():
+            if not is_extension_array_dtype(values.dtype):
+                continue
+            if is_integer_dtype(values.dtype):
+                converted[column] = values.astype(FLOAT)
+            else:
+                converted[column] = values.astype(object).where(values.notna(), np.nan)
+
+        return df.assign(**converted) if converted else df
 
     def _read_feed_extra_from_path(self, path: Union[Path, str]):
+        """Read GTFS extra data
+
+        This helper will read defined extra data from files which are ignored
+        by gtfs_kit. Zipped feeds are streamed straight from the archive.
+        """
         path = Path(path)
         if not path.exists():
             raise ValueError(f"Path {path} does not exist")
 
-        # Unzip path to temporary directory if necessary
-        if path.is_file():
-            zipped = True
-            tmp_dir = tempfile.TemporaryDirectory()
-            src_path = Path(tmp_dir.name)
-            shutil.unpack_archive(str(path), tmp_dir.name, "zip")
-        else:
-            zipped = False
-            src_path = path
-
         feed_extra_dict = {key: None for key in self.EXTRA_FILES}
-        for p in src_path.iterdir():
-            dataset_file = p.stem
-            # Skip empty files, irrelevant files, and files with no data
-            if (
-                p.is_file()
-                and p.stat().st_size
-                and p.suffix == ".txt"
-                and dataset_file in self.EXTRA_FILES
-            ):
-                with open(p, newline="") as csvfile:
-                    csv_reader = csv.reader(csvfile)
-                    headers = next(csv_reader)
-                    GtfsRow = namedtuple(dataset_file, headers)
-                    feed_extra_dict[dataset_file] = list(map(GtfsRow._make, csv_reader))
-
-        # Delete temporary directory
-        if zipped:
-            tmp_dir.cleanup()
+        with self._open_feed_files(path) as feed_files:
+            for dataset_file in self.EXTRA_FILES:
+                if dataset_file in feed_files:
+                    with feed_files[dataset_file]() as f:
+                        feed_extra_dict[dataset_file] = self._read_extra_file(
+                            io.TextIOWrapper(f, encoding="utf-8-sig", newline=""),
+                            dataset_file,
+                        )
 
         return feed_extra_dict
 
-    def _read_feed_extra_from_url(self, url: str):
-        f = tempfile.NamedTemporaryFile(delete=False)
-        with requests.get(url) as r:
-            f.write(r._content)
-        f.close()
-        feed = self._read_feed_extra_from_path(f.name)
-        Path(f.name).unlink()
-        return feed
+    def _read_gtfs_tables(self, path: Path, skip_tables: Iterable[str] = ()):
+        """Read the GTFS tables like gtfs_kit.read_feed() does with explicit dtypes.
+
+        The skipped tables are not read.
+        """
+        feed_dict = {}
+        with self._open_feed_files(path) as feed_files:
+            for table in set(gtfs_kit.constants.GTFS_REF["table"]) - set(skip_tables):
+                if table in feed_files:
+                    with feed_files[table]() as f:
+                        df = pd.read_csv(
+                            f, dtype=self._get_dtypes(table), encoding="utf-8-sig"
+                        )
+                    if not df.empty:
+                        feed_dict[table] = self._convert_int_columns(
+                            gtfs_kit.clean_column_names(df), table
+                        )
+
+        return gtfs_kit.Feed(dist_units="km", **feed_dict)
+
+    def _read_table_ids(self, path: Path, table: str) -> Optional[pd.DataFrame]:
+        """Return the distinct values of the table's ID columns other tables refer to.
+
+        The columns are of different lengths, so the shorter ones are padded with
+        NaNs.
+        """
+        columns = self.REFERENCED_ID_COLUMNS[table]
+        with self._open_feed_files(path) as feed_files:
+            if table not in feed_files:
+                return None
+            with feed_files[table]() as f:
+                ids = {column: set() for column in columns}
+                for chunk in pd.read_csv(
+                    f,
+                    dtype=self._get_dtypes(table),
+                    encoding="utf-8-sig",
+                    chunksize=self.ID_CHUNK_SIZE,
+                    usecols=lambda column: column.strip() in columns,
+                ):
+                    chunk = gtfs_kit.clean_column_names(chunk)
+                    for column in columns:
+                        ids[column].update(chunk[column].dropna().unique())
+
+        return pd.DataFrame(
+            {column: pd.Series(sorted(values)) for column, values in ids.items()}
+        )
+
+    @staticmethod
+    def _get_dtypes(table: str) -> Dict:
+        return {
+            **gtfs_kit.constants.DTYPE,
+            **{
+                column: FLOAT if dtype == INT else dtype
+                for column, dtype in GTFS_TABLE_DTYPES.get(table, {}).items()
+            },
+        }
+
+    @staticmethod
+    def _convert_int_columns(df: pd.DataFrame, table: str) -> pd.DataFrame:
+        """Round the integer columns read as floats to nullable integers."""
+        converted = {
+            column: df[column].round().astype(INT)
+            for column, dtype in GTFS_TABLE_DTYPES.get(table, {}).items()
+            if dtype == INT and column in df
+        }
+        return df.assign(**converted) if converted else df
+
+    @staticmethod
+    @contextmanager
+    def _open_feed_files(path: Union[Path, str]):
+        """Yield openers of the feed's non-empty text files by file name stem.
+
+        Zipped feeds are streamed straight from the archive without unpacking it.
+        """
+        path = Path(path)
+        if path.is_file():
+            with zipfile.ZipFile(path) as archive:
+                yield {
+                    # only files in the root of the feed
+                    Path(info.filename).stem: partial(archive.open, info)
+                    for info in archive.infolist()
+                    if "/" not in info.filename
+                    and info.filename.endswith(".txt")
+                    and info.file_size
+                }
+        else:
+            yield {
+                p.stem: partial(open, p, "rb")
+                for p in path.iterdir()
+                if p.is_file() and p.suffix == ".txt" and p.stat().st_size
+            }
+
+    @staticmethod
+    def _read_extra_file(csvfile, dataset_file: str) -> List:
+        csv_reader = csv.reader(csvfile)
+        headers = next(csv_reader)
+        row_class = get_extra_row_class(dataset_file, tuple(headers))
+        return list(map(row_class._make, csv_reader))
 
     def get_feed_fingerprint(self, feed: Feed) -> str:
         """Return a fingerprint for the feed.
@@ -137,24 +726,21 @@ class GTFSFeedReader:
         be updated.
 
         Logic will return the first item on the following list:
+        - the current fingerprint if the feed hasn't been modified according to
+          a conditional request
         - HTTP last-modified header
         - sha1 hash of the zip file
         - date of last import (fallback to import once per day)
         """
-        fingerprint = None
-
         try:
-            response = requests.head(feed.url_or_path)
-            response.raise_for_status()
-            if timestamp := response.headers.get("last-modified"):
-                fingerprint = timestamp
-
-            if not fingerprint:
-                response = requests.get(feed.url_or_path)
-                response.raise_for_status()
-                sha1 = hashlib.sha1()
-                sha1.update(response.content)
-                fingerprint = sha1.hexdigest()
+            download = self.download(
+                feed.url_or_path, feed.etag, feed.last_modified, feed.fingerprint
+            )
+            if download is None or download.not_modified:
+                # the feed hasn't changed since it was imported
+                fingerprint = feed.fingerprint
+            else:
+                fingerprint = download.last_modified or download.sha1
         except RequestException:
             fingerprint = localdate().isoformat()
 
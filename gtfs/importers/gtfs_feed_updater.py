@@ -1,60 +1,205 @@
 import logging
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from timeit import default_timer as timer
+from typing import NamedTuple, Optional, Tuple
 
 from django.db import transaction
 from django.utils import timezone
 from requests import RequestException
 
 from gtfs.importers import GTFSFeedImporter
-from gtfs.importers.gtfs_feed_importer import GTFSFeedImporterError
-from gtfs.importers.gtfs_feed_reader import GTFSFeedReader
-from gtfs.models import Feed
+from gtfs.importers.gtfs_feed_collector import GTFSFeedCollector
+from gtfs.importers.gtfs_feed_importer import GTFSFeedData, GTFSFeedImporterError
+from gtfs.models import Feed, ImportRun
+
+
+class FeedUpdate(NamedTuple):
+    # None when the feed doesn't need to be updated
+    feed_data: Optional[GTFSFeedData]
+    error: Optional[Exception]
+    read_time: float
+    started_at: datetime
+    # the ETag and Last-Modified of a feed URL, stored also when the feed is unchanged
+    validators: Optional[Tuple[str, str]] = None
+
+
+def read_feed_update(
+    feed: Feed,
+    force: bool = False,
+    skip_validation: bool = False,
+    importer: Optional[GTFSFeedImporter] = None,
+) -> FeedUpdate:
+    """Fingerprint the feed and read and validate it if it needs to be updated.
+
+    This doesn't access the database, so it can be run in a worker process. Errors
+    are returned instead of raised so that they can be saved to the feed.
+    """
+    importer = importer or GTFSFeedImporter()
+    started_at = timezone.now()
+    start_time = timer()
+    feed_data = None
+    error = None
+    validators = None
+
+    try:
+        fingerprint = importer.feed_reader.get_feed_fingerprint(feed)
+        validators = importer.feed_reader.validators.get(feed.url_or_path)
+        if fingerprint != feed.fingerprint or force:
+            feed_data = importer.read(feed, skip_validation)
+        else:
+            importer.logger.info(
+                f'No need to update feed "{feed.name}", same fingerprint: "{feed.fingerprint}"'
+            )
+    # catch everything so that even for bugs the feed's last import status is
+    # correctly set to unsuccessful
+    except Exception as e:  # noqa
+        error = e
+    finally:
+        importer.feed_reader.cleanup()
+
+    return FeedUpdate(feed_data, error, timer() - start_time, started_at, validators)
 
 
 class GTFSFeedUpdater:
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        load_engine=GTFSFeedImporter.LOAD_ENGINE_ORM,
+        incremental=False,
+        chunk_size=None,
+        trace_memory=False,
+        staging=False,
+    ):
         self.logger = logger or logging.getLogger(__name__)
-        self.importer = GTFSFeedImporter()
-        self.reader = GTFSFeedReader()
+        self.importer = GTFSFeedImporter(
+            load_engine=load_engine,
+            incremental=incremental,
+            chunk_size=chunk_size,
+            trace_memory=trace_memory,
+            staging=staging,
+        )
+        self.collector = GTFSFeedCollector(logger=self.logger)
+        # share the importer's reader, so that a feed downloaded for fingerprinting
+        # doesn't need to be downloaded again for importing
+        self.reader = self.importer.feed_reader
+
+    def update_feeds(self, force: bool = False, workers: int = 1):
+        """Update all feeds.
 
-    def update_feeds(self, force: bool = False):
-        for feed in Feed.objects.all():
+        With more than one worker the feeds are fingerprinted, downloaded, parsed and
+        validated concurrently in worker processes, the database writes are still
+        done one feed at a time in this process.
+
+        When staging, the data that is no longer served is deleted after all of the
+        feeds have been updated.
+        """
+        start_time = timer()
+        timings = []
+
+        for feed, update in self._read_feed_updates(force, workers):
+            save_start_time = timer()
             try:
-                self.update_single_feed(feed, force=force)
+                self._save_feed_update(feed, update)
             except (RequestException, GTFSFeedImporterError):
                 self.logger.exception(f'Failed to update feed: "{feed.name}"')
+            timings.append((feed, update.read_time, timer() - save_start_time))
+
+        self.logger.info(
+            f"Updated {len(timings)} feeds in {timer() - start_time:.2f} secs"
+        )
+        for feed, read_time, save_time in timings:
+            self.logger.info(
+                f'Feed "{feed.name or feed.url_or_path}": read in {read_time:.2f} '
+                f"secs, saved in {save_time:.2f} secs"
+            )
+
+        if self.importer.staging:
+            self.collector.collect()
 
     def update_single_feed(
         self, feed: Feed, force: bool = False, skip_validation: bool = False
     ):
-        imported = False
+        update = read_feed_update(feed, force, skip_validation, importer=self.importer)
+        self._save_feed_update(feed, update)
+
+    def _read_feed_updates(self, force, workers):
+        feeds = list(Feed.objects.exclude_versions())
+
+        if workers <= 1:
+            for feed in feeds:
+                yield feed, read_feed_update(feed, force, importer=self.importer)
+            return
+
+        # the workers read the feeds the same way as our importer, but with their own
+        # importers
+        importer = GTFSFeedImporter(
+            chunk_size=self.importer.chunk_size,
+            trace_memory=self.importer.profiler.trace_memory,
+        )
+        # fork so that the workers have Django already set up, they don't touch the
+        # database
+        with ProcessPoolExecutor(workers, mp_context=get_context("fork")) as executor:
+            futures = {
+                executor.submit(read_feed_update, feed, force, importer=importer): feed
+                for feed in feeds
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _save_feed_update(self, feed: Feed, update: FeedUpdate):
+        exception = update.error
 
         with transaction.atomic():
-            try:
-                fingerprint = self.reader.get_feed_fingerprint(feed)
-                if fingerprint != feed.fingerprint or force:
-                    self.importer.run(feed, skip_validation)
-                    imported = True
-                else:
+            if update.feed_data and not exception:
+                try:
+                    self.importer.load(feed, update.feed_data)
                     self.logger.info(
-                        f'No need to update feed "{feed.name}", same fingerprint: "{feed.fingerprint}"'
+                        f'Successfully imported GTFS feed "{feed.name or "<no name>"}" '
+                        f'from "{feed.url_or_path}"'
                     )
-            # catch everything so that even for bugs the feed's last import status is
-            # correctly set to unsuccessful
-            except Exception as e:  # noqa
-                feed.last_import_error_message = str(e)
+                # catch everything so that even for bugs the feed's last import status
+                # is correctly set to unsuccessful
+                except Exception as e:  # noqa
+                    exception = e
+
+            if exception:
+                feed.last_import_error_message = str(exception)
                 feed.import_attempted_at = timezone.now()
-                exception = e
             else:
                 feed.last_import_error_message = ""
-                if imported:
-                    # after an actual successful import make import_attempted_at match
-                    # its time exactly
+                if update.feed_data:
+                    # after an actual successful import make import_attempted_at
+                    # match its time exactly
                     feed.import_attempted_at = feed.imported_at
                 else:
                     feed.import_attempted_at = timezone.now()
-                exception = None
-            finally:
-                feed.save()
+                    if update.validators:
+                        # so that the next update is a conditional request
+                        feed.etag, feed.last_modified = update.validators
+            feed.save()
+
+            if update.feed_data or exception:
+                self._save_import_run(feed, update, exception)
 
         if exception:
             raise exception
+
+    def _save_import_run(
+        self, feed: Feed, update: FeedUpdate, exception: Optional[Exception]
+    ):
+        import_run = ImportRun(
+            feed=feed,
+            started_at=update.started_at,
+            finished_at=feed.import_attempted_at,
+            fingerprint=update.feed_data.fingerprint if update.feed_data else "",
+            successful=not exception,
+            error_message=str(exception) if exception else "",
+            phases=self.importer.profiler.as_list() if update.feed_data else [],
+        )
+        if not exception:
+            import_run.row_counts = dict(self.importer.row_counts)
+            import_run.bytes_written = self.importer.bytes_written
+            import_run.populate_rows_per_second()
+        import_run.save()
@@ -0,0 +1,153 @@
+import resource
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from timeit import default_timer as timer
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection
+
+
+class ImportPhase:
+    """Measurements of a single import phase, collected over one or more runs."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.rows = 0
+        self.queries = 0
+        # how much the phase raised the peak resident set size of the process, the
+        # peak never drops so a phase below an earlier peak doesn't raise it at all
+        self.max_rss_increase = 0
+        # peak memory allocated during the phase, only when tracing memory
+        self.peak_memory = None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        if not self.rows or not self.seconds:
+            return None
+        return self.rows / self.seconds
+
+    def as_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 3),
+            "rows": self.rows,
+            "rows_per_second": (
+                round(self.rows_per_second, 1) if self.rows_per_second else None
+            ),
+            "queries": self.queries,
+            "max_rss_increase": self.max_rss_increase,
+            "peak_memory": self.peak_memory,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ImportPhase":
+        phase = cls(data["name"])
+        for attribute in (
+            "seconds",
+            "rows",
+            "queries",
+            "max_rss_increase",
+            "peak_memory",
+        ):
+            setattr(phase, attribute, data[attribute])
+        return phase
+
+
+class ImportProfiler:
+    """Measure the phases of an import.
+
+    For every phase the wall time, number of processed rows, number of database
+    queries and memory usage are collected. Running a phase with the same name again
+    adds to its measurements, so e.g. chunks of a table are reported as one phase.
+
+    Tracing the memory allocations with tracemalloc slows the import down
+    considerably, so it is done only when trace_memory is set, and only during the
+    phases. How much each phase raises the process' peak resident set size is always
+    recorded.
+
+    Queries that bypass Django's execute wrappers, like COPY, need to be counted with
+    count_query().
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.current_phase = None
+
+    def reset(self, phases: Iterable[Dict] = ()):
+        """Start a new profile, optionally continuing from the given phases."""
+        self.phases = {data["name"]: ImportPhase.from_dict(data) for data in phases}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure a phase, yields the phase so that rows can be added to it."""
+        if name not in self.phases:
+            self.phases[name] = ImportPhase(name)
+        phase = self.phases[name]
+
+        def count_queries(execute, sql, params, many, context):
+            phase.queries += 1
+            return execute(sql, params, many, context)
+
+        was_tracing = self._start_tracing_memory() if self.trace_memory else False
+        start_max_rss = self._get_max_rss()
+        start_time = timer()
+        self.current_phase = phase
+        try:
+            with connection.execute_wrapper(count_queries):
+                yield phase
+        finally:
+            self.current_phase = None
+            phase.seconds += timer() - start_time
+            phase.max_rss_increase += self._get_max_rss() - start_max_rss
+            if self.trace_memory:
+                _current, peak = tracemalloc.get_traced_memory()
+                phase.peak_memory = max(phase.peak_memory or 0, peak)
+                if not was_tracing:
+                    tracemalloc.stop()
+
+    def count_query(self):
+        """Count a query that Django's execute wrappers don't see."""
+        if self.current_phase:
+            self.current_phase.queries += 1
+
+    def as_list(self) -> List[Dict]:
+        return [phase.as_dict() for phase in self.phases.values()]
+
+    def get_report(self) -> str:
+        lines = [
+            f"{'phase':<30} {'secs':>9} {'rows':>10} {'rows/s':>10} {'queries':>8} "
+            f"{'+RSS MB':>10} {'peak MB':>8}"
+        ]
+        for phase in self.phases.values():
+            rows_per_second = phase.rows_per_second
+            peak_memory = phase.peak_memory
+            lines.append(
+                f"{phase.name:<30} {phase.seconds:>9.2f} {phase.rows:>10} "
+                f"{f'{rows_per_second:.0f}' if rows_per_second else '-':>10} "
+                f"{phase.queries:>8} {phase.max_rss_increase / 2 ** 20:>10.1f} "
+                f"{f'{peak_memory / 2 ** 20:.1f}' if peak_memory else '-':>8}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _start_tracing_memory() -> bool:
+        """Start tracing, returns whether the memory was already being traced.
+
+        Tracing started elsewhere is left on, on Python < 3.9 without reset_peak() the
+        peak is then the peak since the tracing was started.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            return False
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        return True
+
+    @staticmethod
+    def _get_max_rss() -> int:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
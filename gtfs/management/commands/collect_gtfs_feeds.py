@@ -0,0 +1,18 @@
+from django.core.management import BaseCommand
+
+from gtfs.importers.gtfs_feed_collector import GTFSFeedCollector
+
+
+class Command(BaseCommand):
+    help = "Deletes GTFS data that is no longer served after staged imports."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of objects deleted in a single transaction.",
+        )
+
+    def handle(self, *args, **options):
+        GTFSFeedCollector(batch_size=options["batch_size"]).collect()
@@ -1,7 +1,7 @@
 from django.core.management import BaseCommand
 from django.db import transaction
 
-from gtfs.importers import GTFSFeedUpdater
+from gtfs.importers import GTFSFeedImporter, GTFSFeedUpdater
 from gtfs.models import Feed
 
 
@@ -11,13 +11,45 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("url_or_path", type=str)
         parser.add_argument("--skip-validation", action="store_true")
+        parser.add_argument(
+            "--load-engine",
+            choices=GTFSFeedImporter.LOAD_ENGINES,
+            default=GTFSFeedImporter.LOAD_ENGINE_ORM,
+            help='How to write the data to the database, "copy" uses PostgreSQL COPY.',
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Write only the changes instead of deleting and importing all data.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Read and import stop times and shapes this many rows at a time.",
+        )
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Measure the peak memory of each import phase, slows down the import.",
+        )
+        parser.add_argument(
+            "--staging",
+            action="store_true",
+            help="Import into a new version of the feed and serve it once imported.",
+        )
 
     def handle(self, *args, **options):
-        updater = GTFSFeedUpdater()
+        updater = GTFSFeedUpdater(
+            load_engine=options["load_engine"],
+            incremental=options["incremental"],
+            chunk_size=options["chunk_size"],
+            trace_memory=options["trace_memory"],
+            staging=options["staging"],
+        )
         url_or_path = options["url_or_path"]
 
         try:
-            feed = Feed.objects.get(url_or_path=url_or_path)
+            feed = Feed.objects.exclude_versions().get(url_or_path=url_or_path)
         except Feed.DoesNotExist:
             feed = Feed(url_or_path=url_or_path)
 
@@ -31,3 +63,6 @@ class Command(BaseCommand):
                 )
         else:
             updater.update_single_feed(feed, skip_validation=options["skip_validation"])
+
+        if options["staging"]:
+            updater.collector.collect()
@@ -0,0 +1,34 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from gtfs.importers import GTFSFeedImporter
+from gtfs.models import Feed, StopDeparture
+
+
+class Command(BaseCommand):
+    help = (
+        "Populates the stop departures of the served GTFS feeds, one feed per "
+        "transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild also the feeds that already have stop departures.",
+        )
+
+    def handle(self, *args, **options):
+        importer = GTFSFeedImporter()
+        for feed in Feed.objects.exclude_versions().select_related("serving_version"):
+            data_feed = feed.data_feed
+            if (
+                not options["all"]
+                and StopDeparture.objects.filter(feed=data_feed).exists()
+            ):
+                continue
+            with transaction.atomic():
+                num_of_stop_departures = importer.populate_stop_departures(data_feed)
+            importer.logger.info(
+                f'Populated {num_of_stop_departures} stop departures of "{feed}"'
+            )
@@ -1,6 +1,6 @@
 from django.core.management import BaseCommand
 
-from gtfs.importers import GTFSFeedUpdater
+from gtfs.importers import GTFSFeedImporter, GTFSFeedUpdater
 
 
 class Command(BaseCommand):
@@ -12,7 +12,45 @@ class Command(BaseCommand):
             action="store_true",
             help="Update all existing feeds by not checking if they've really been updated.",
         )
+        parser.add_argument(
+            "--load-engine",
+            choices=GTFSFeedImporter.LOAD_ENGINES,
+            default=GTFSFeedImporter.LOAD_ENGINE_ORM,
+            help='How to write the data to the database, "copy" uses PostgreSQL COPY.',
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Write only the changes instead of deleting and importing all data.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Read and import stop times and shapes this many rows at a time.",
+        )
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Measure the peak memory of each import phase, slows down the import.",
+        )
+        parser.add_argument(
+            "--staging",
+            action="store_true",
+            help="Import into a new version of the feed and serve it once imported.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used to download, parse and validate the feeds.",
+        )
 
     def handle(self, *args, **options):
-        updater = GTFSFeedUpdater()
-        updater.update_feeds(force=options["force"])
+        updater = GTFSFeedUpdater(
+            load_engine=options["load_engine"],
+            incremental=options["incremental"],
+            chunk_size=options["chunk_size"],
+            trace_memory=options["trace_memory"],
+            staging=options["staging"],
+        )
+        updater.update_feeds(force=options["force"], workers=options["workers"])
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0026_add_stop_time_stops_after_this"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="etag",
+            field=models.CharField(
+                blank=True,
+                help_text="ETag of the imported feed, used in conditional requests.",
+                max_length=255,
+                verbose_name="ETag",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="last_modified",
+            field=models.CharField(
+                blank=True,
+                help_text="Last-Modified header of the imported feed, used in conditional requests.",
+                max_length=255,
+                verbose_name="last modified",
+            ),
+        ),
+    ]
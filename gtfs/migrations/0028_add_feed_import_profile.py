@@ -0,0 +1,23 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0027_add_feed_etag_and_last_modified"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="import_profile",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Time, rows, queries and memory used by each phase of the import.",
+                verbose_name="import profile",
+            ),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0028_add_feed_import_profile"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started_at", models.DateTimeField(verbose_name="started at")),
+                ("finished_at", models.DateTimeField(verbose_name="finished at")),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="fingerprint"
+                    ),
+                ),
+                ("successful", models.BooleanField(verbose_name="successful")),
+                (
+                    "error_message",
+                    models.TextField(blank=True, verbose_name="error message"),
+                ),
+                (
+                    "row_counts",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Number of imported rows by GTFS table.",
+                        verbose_name="row counts",
+                    ),
+                ),
+                (
+                    "phases",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Time, rows, queries and memory used by each phase of the import.",
+                        verbose_name="phases",
+                    ),
+                ),
+                (
+                    "bytes_written",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="Amount of write-ahead log the import generated in the database.",
+                        null=True,
+                        verbose_name="bytes written",
+                    ),
+                ),
+                (
+                    "rows_per_second",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Imported rows per second spent in the import phases.",
+                        null=True,
+                        verbose_name="rows per second",
+                    ),
+                ),
+                (
+                    "feed",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="import_runs",
+                        to="gtfs.feed",
+                        verbose_name="feed",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "import run",
+                "verbose_name_plural": "import runs",
+                "ordering": ("-started_at",),
+                "default_related_name": "import_runs",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="importrun",
+            index=models.Index(
+                fields=["feed", "started_at"], name="gtfs_import_feed_id_99f1b0_idx"
+            ),
+        ),
+    ]
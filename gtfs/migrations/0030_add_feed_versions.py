@@ -0,0 +1,80 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0029_add_import_run"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="serving_version",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The version whose data is served, the feed's own data is served if not set.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="gtfs.feed",
+                verbose_name="serving version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="version_of",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Set for a hidden version of the feed, staged imports import the feed's data into a new version.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="versions",
+                to="gtfs.feed",
+                verbose_name="version of",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="agency",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="departure",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="fare",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="ridercategory",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="route",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="shape",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="stop",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="trip",
+            name="api_id",
+            field=models.UUIDField(db_index=True, verbose_name="API ID"),
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Min
+
+
+def populate_route_stops(apps, schema_editor):
+    Route = apps.get_model("gtfs", "Route")
+    RouteStop = apps.get_model("gtfs", "RouteStop")
+    for route in Route.objects.all():
+        RouteStop.objects.bulk_create(
+            RouteStop(
+                feed_id=route.feed_id,
+                route=route,
+                stop_id=values["stop_times__stop_id"],
+                direction_id=values["direction_id"],
+                first_stop_sequence=values["first_stop_sequence"],
+            )
+            for values in route.trips.values(
+                "stop_times__stop_id", "direction_id"
+            ).annotate(first_stop_sequence=Min("stop_times__stop_sequence"))
+            if values["stop_times__stop_id"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0030_add_feed_versions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RouteStop",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "direction_id",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="direction ID"
+                    ),
+                ),
+                (
+                    "first_stop_sequence",
+                    models.PositiveIntegerField(
+                        help_text="The smallest stop sequence of the stop on the route's trips.",
+                        verbose_name="first stop sequence",
+                    ),
+                ),
+                (
+                    "feed",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="route_stops",
+                        to="gtfs.feed",
+                        verbose_name="feed",
+                    ),
+                ),
+                (
+                    "route",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="route_stops",
+                        to="gtfs.route",
+                        verbose_name="route",
+                    ),
+                ),
+                (
+                    "stop",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="route_stops",
+                        to="gtfs.stop",
+                        verbose_name="stop",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "route stop",
+                "verbose_name_plural": "route stops",
+                "default_related_name": "route_stops",
+            },
+        ),
+        migrations.AddField(
+            model_name="route",
+            name="stops",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="routes",
+                through="gtfs.RouteStop",
+                to="gtfs.Stop",
+                verbose_name="stops",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="routestop",
+            constraint=models.UniqueConstraint(
+                fields=("route", "stop", "direction_id"),
+                name="unique_route_stop_direction",
+            ),
+        ),
+        migrations.RunPython(populate_route_stops, migrations.RunPython.noop),
+    ]
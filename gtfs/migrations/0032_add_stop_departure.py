@@ -0,0 +1,111 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0031_add_route_stop"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StopDeparture",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("api_id", models.UUIDField(verbose_name="API ID")),
+                ("date", models.DateField(verbose_name="date")),
+                (
+                    "direction_id",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="direction ID"
+                    ),
+                ),
+                (
+                    "stops_after_this",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="stops after this"
+                    ),
+                ),
+                (
+                    "arrival_time",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="arrival time"
+                    ),
+                ),
+                (
+                    "departure_time",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="departure time"
+                    ),
+                ),
+                (
+                    "departure",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stop_departures",
+                        to="gtfs.departure",
+                        verbose_name="departure",
+                    ),
+                ),
+                (
+                    "feed",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stop_departures",
+                        to="gtfs.feed",
+                        verbose_name="feed",
+                    ),
+                ),
+                (
+                    "route",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stop_departures",
+                        to="gtfs.route",
+                        verbose_name="route",
+                    ),
+                ),
+                (
+                    "stop",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stop_departures",
+                        to="gtfs.stop",
+                        verbose_name="stop",
+                    ),
+                ),
+                (
+                    "stop_time",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stop_departures",
+                        to="gtfs.stoptime",
+                        verbose_name="stop time",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "stop departure",
+                "verbose_name_plural": "stop departures",
+                "default_related_name": "stop_departures",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="stopdeparture",
+            index=models.Index(
+                fields=["stop", "date", "departure_time"],
+                name="gtfs_stopde_stop_id_953637_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, transaction
+
+
+def populate_stop_departures(apps, schema_editor):
+    Feed = apps.get_model("gtfs", "Feed")
+    StopDeparture = apps.get_model("gtfs", "StopDeparture")
+    connection = schema_editor.connection
+    tables = {
+        model_name: connection.ops.quote_name(
+            apps.get_model("gtfs", model_name)._meta.db_table
+        )
+        for model_name in (
+            "Agency",
+            "Departure",
+            "Route",
+            "StopDeparture",
+            "StopTime",
+            "Trip",
+        )
+    }
+
+    # one feed per transaction, the feeds already populated are skipped so that
+    # an interrupted migration can be continued
+    for feed_id in Feed.objects.order_by("id").values_list("id", flat=True):
+        if StopDeparture.objects.filter(feed_id=feed_id).exists():
+            continue
+        with transaction.atomic(), connection.cursor() as cursor:
+            # the same as GTFSFeedImporter.populate_stop_departures()
+            cursor.execute(
+                f"""
+                INSERT INTO {tables['StopDeparture']} (
+                    feed_id, departure_id, api_id, stop_time_id, stop_id, route_id,
+                    date, direction_id, stops_after_this, arrival_time,
+                    departure_time
+                )
+                SELECT
+                    %(feed_id)s,
+                    departure.id,
+                    departure.api_id,
+                    stop_time.id,
+                    stop_time.stop_id,
+                    trip.route_id,
+                    departure.date,
+                    trip.direction_id,
+                    stop_time.stops_after_this,
+                    (departure.date + stop_time.arrival_time)
+                        AT TIME ZONE agency.timezone,
+                    (departure.date + stop_time.departure_time)
+                        AT TIME ZONE agency.timezone
+                FROM {tables['Departure']} AS departure
+                JOIN {tables['Trip']} AS trip ON trip.id = departure.trip_id
+                JOIN {tables['StopTime']} AS stop_time
+                    ON stop_time.trip_id = trip.id
+                JOIN {tables['Route']} AS route ON route.id = trip.route_id
+                JOIN {tables['Agency']} AS agency ON agency.id = route.agency_id
+                WHERE trip.feed_id = %(feed_id)s
+                """,
+                {"feed_id": feed_id},
+            )
+
+
+class Migration(migrations.Migration):
+
+    # populated feed by feed instead of all of them in a single transaction
+    atomic = False
+
+    dependencies = [
+        ("gtfs", "0032_add_stop_departure"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_stop_departures, migrations.RunPython.noop),
+    ]
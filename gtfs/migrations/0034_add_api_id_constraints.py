@@ -0,0 +1,102 @@
+# Generated by Django 3.2.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gtfs", "0033_populate_stop_departures"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="agency",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="fare",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="ridercategory",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="route",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="shape",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="stop",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AlterField(
+            model_name="trip",
+            name="api_id",
+            field=models.UUIDField(verbose_name="API ID"),
+        ),
+        migrations.AddConstraint(
+            model_name="agency",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_agency"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="fare",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_fare"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="ridercategory",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_ridercategory"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="route",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_route"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="shape",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_shape"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="stop",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_stop"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="stopdeparture",
+            constraint=models.UniqueConstraint(
+                fields=("departure", "stop_time"), name="unique_departure_stop_time"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="trip",
+            constraint=models.UniqueConstraint(
+                fields=("feed", "source_id"), name="unique_feed_gtfs_trip"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="trip",
+            constraint=models.UniqueConstraint(
+                fields=("api_id", "feed"), name="unique_api_id_gtfs_trip"
+            ),
+        ),
+    ]
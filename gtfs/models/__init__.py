@@ -5,10 +5,13 @@ from .fare import Fare
 from .fare_rider_category import FareRiderCategory
 from .fare_rule import FareRule
 from .feed import Feed, FeedInfo
+from .import_run import ImportRun
 from .rider_category import RiderCategory
 from .route import Route
+from .route_stop import RouteStop
 from .shape import Shape
 from .stop import Stop
+from .stop_departure import StopDeparture
 from .stop_time import StopTime
 from .trip import Trip
 
@@ -22,10 +25,13 @@ __all__ = [
     "FeedInfo",
     "GTFSModel",
     "GTFSModelWithSourceID",
+    "ImportRun",
     "RiderCategory",
     "Route",
+    "RouteStop",
     "Shape",
     "Stop",
+    "StopDeparture",
     "StopTime",
     "Trip",
 ]
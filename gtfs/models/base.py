@@ -37,7 +37,8 @@ class GTFSModel(models.Model):
 
 class GTFSModelWithSourceID(GTFSModel):
     source_id = models.CharField(verbose_name=_("source ID"), max_length=255)
-    api_id = models.UUIDField(verbose_name=_("API ID"), unique=True)
+    # unique per feed, a feed's staged version has the same API IDs as the served one
+    api_id = models.UUIDField(verbose_name=_("API ID"))
 
     class Meta:
         abstract = True
@@ -45,14 +46,22 @@ class GTFSModelWithSourceID(GTFSModel):
             models.UniqueConstraint(
                 fields=["feed", "source_id"],
                 name="unique_feed_%(app_label)s_%(class)s",
-            )
+            ),
+            # API ID first, so that the index also serves lookups by API ID
+            models.UniqueConstraint(
+                fields=["api_id", "feed"],
+                name="unique_api_id_%(app_label)s_%(class)s",
+            ),
         ]
 
-    def populate_api_id(self):
-        self.api_id = uuid5(
-            API_ID_NAMESPACE,
-            f"{self.__class__.__name__}:{self.feed_id}:{self.source_id}",
-        )
+    @classmethod
+    def build_api_id(cls, feed_id, source_id):
+        return uuid5(API_ID_NAMESPACE, f"{cls.__name__}:{feed_id}:{source_id}")
+
+    def populate_api_id(self, api_feed_id=None):
+        # the API IDs of a feed's versions are built from the feed's ID, the importer
+        # that writes the versions passes it in so that the feed isn't fetched here
+        self.api_id = self.build_api_id(api_feed_id or self.feed_id, self.source_id)
 
     def save(self, *args, **kwargs):
         if not self.api_id:
@@ -13,11 +13,13 @@ from .trip import Trip
 class DepartureQueryset(models.QuerySet):
     def for_maas_operator(self, maas_operator: MaasOperator):
         feeds = Feed.objects.for_maas_operator(maas_operator)
-        return self.filter(trip__feed__in=feeds)
+        return self.filter(trip__feed__in=feeds.serving_feed_ids())
 
 
 class Departure(models.Model):
-    api_id = models.UUIDField(verbose_name=_("API ID"), unique=True)
+    # not unique, a feed's staged version has the same API IDs as the served one.
+    # Unique per feed, since the trips are unique per feed and the dates per trip.
+    api_id = models.UUIDField(verbose_name=_("API ID"), db_index=True)
     trip = models.ForeignKey(
         Trip,
         verbose_name=_("trip"),
@@ -41,10 +43,22 @@ class Departure(models.Model):
     def __str__(self):
         return f"{self.date} {self.trip}"
 
-    def populate_api_id(self):
-        self.api_id = uuid5(
-            API_ID_NAMESPACE,
-            f"{self.__class__.__name__}:{self.trip.feed_id}:{self.trip.source_id}:{self.date}",
+    @classmethod
+    def build_api_id(cls, feed_id, trip_source_id, date):
+        return cls.build_api_ids(feed_id, [trip_source_id], [date])[0]
+
+    @classmethod
+    def build_api_ids(cls, feed_id, trip_source_ids, dates):
+        prefix = f"{cls.__name__}:{feed_id}:"
+        return [
+            uuid5(API_ID_NAMESPACE, f"{prefix}{trip_source_id}:{date}")
+            for trip_source_id, date in zip(trip_source_ids, dates)
+        ]
+
+    def populate_api_id(self, api_feed_id=None):
+        # see GTFSModelWithSourceID.populate_api_id()
+        self.api_id = self.build_api_id(
+            api_feed_id or self.trip.feed_id, self.trip.source_id, self.date
         )
 
     def save(self, *args, **kwargs):
@@ -1,4 +1,6 @@
 from django.contrib.gis.db import models
+from django.db.models import DEFERRED
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from maas.models import MaasOperator
@@ -8,10 +10,25 @@ from .base import GTFSModel
 
 class FeedQueryset(models.QuerySet):
     def for_maas_operator(self, maas_operator: MaasOperator):
-        return self.filter(
+        # versions have their feed's ticketing system, but they are never served as
+        # feeds of their own
+        return self.exclude_versions().filter(
             ticketing_system__transport_service_providers__maas_operators=maas_operator
         )
 
+    def exclude_versions(self):
+        return self.filter(version_of__isnull=True)
+
+    def serving_feed_ids(self):
+        """Return the IDs of the feeds whose GTFS data is served for these feeds.
+
+        That is the feed's serving version if it has one, otherwise the feed itself.
+        """
+        return self.values_list(
+            Coalesce("serving_version", "id", output_field=models.IntegerField()),
+            flat=True,
+        )
+
 
 class Feed(models.Model):
     created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
@@ -49,6 +66,50 @@ class Feed(models.Model):
             "This value will be used to determine if the feed should be updated."
         ),
     )
+    etag = models.CharField(
+        verbose_name=_("ETag"),
+        max_length=255,
+        blank=True,
+        help_text=_("ETag of the imported feed, used in conditional requests."),
+    )
+    last_modified = models.CharField(
+        verbose_name=_("last modified"),
+        max_length=255,
+        blank=True,
+        help_text=_(
+            "Last-Modified header of the imported feed, used in conditional requests."
+        ),
+    )
+    version_of = models.ForeignKey(
+        "self",
+        verbose_name=_("version of"),
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="versions",
+        help_text=_(
+            "Set for a hidden version of the feed, staged imports import the feed's "
+            "data into a new version."
+        ),
+    )
+    serving_version = models.ForeignKey(
+        "self",
+        verbose_name=_("serving version"),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text=_(
+            "The version whose data is served, the feed's own data is served if "
+            "not set."
+        ),
+    )
+    import_profile = models.JSONField(
+        verbose_name=_("import profile"),
+        default=list,
+        blank=True,
+        help_text=_("Time, rows, queries and memory used by each phase of the import."),
+    )
 
     objects = FeedQueryset.as_manager()
 
@@ -57,14 +118,52 @@ class Feed(models.Model):
         verbose_name_plural = _("feeds")
         default_related_name = "feeds"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # DEFERRED when the feed is loaded without its ticketing system
+        instance._saved_ticketing_system_id = dict(zip(field_names, values)).get(
+            "ticketing_system_id", DEFERRED
+        )
+        return instance
+
     def save(self, *args, **kwargs):
-        if not self.name and hasattr(self, "feed_info"):
-            self.name = self.feed_info.publisher_name
+        data_feed = self.data_feed
+        if not self.name and hasattr(data_feed, "feed_info"):
+            self.name = data_feed.feed_info.publisher_name
+        # the versions have the feed's ticketing system, which is needed for
+        # bookings of their routes
+        update_versions = self._ticketing_system_changed()
         super().save(*args, **kwargs)
+        if update_versions:
+            self.versions.update(ticketing_system=self.ticketing_system_id)
+        self._saved_ticketing_system_id = self.__dict__.get(
+            "ticketing_system_id", DEFERRED
+        )
+
+    def _ticketing_system_changed(self):
+        if self._state.adding:
+            return False
+        saved_id = getattr(self, "_saved_ticketing_system_id", DEFERRED)
+        if saved_id is DEFERRED:
+            # not loaded with the feed, so it has changed only if it has been set
+            # since
+            return "ticketing_system_id" in self.__dict__ and not self.version_of_id
+        return not self.version_of_id and self.ticketing_system_id != saved_id
 
     def __str__(self):
         return self.name or self.url_or_path
 
+    @property
+    def data_feed(self):
+        """The feed that has the served GTFS data, the serving version or self."""
+        return self.serving_version or self
+
+    @property
+    def api_feed_id(self):
+        """The feed ID the API IDs are built from, the same for all versions."""
+        return self.version_of_id or self.id
+
     @property
     def last_import_successful(self):
         return (
@@ -0,0 +1,60 @@
+from django.contrib.gis.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .feed import Feed
+
+
+class ImportRun(models.Model):
+    feed = models.ForeignKey(Feed, verbose_name=_("feed"), on_delete=models.CASCADE)
+    started_at = models.DateTimeField(verbose_name=_("started at"))
+    finished_at = models.DateTimeField(verbose_name=_("finished at"))
+    fingerprint = models.CharField(
+        verbose_name=_("fingerprint"), max_length=255, blank=True
+    )
+    successful = models.BooleanField(verbose_name=_("successful"))
+    error_message = models.TextField(verbose_name=_("error message"), blank=True)
+    row_counts = models.JSONField(
+        verbose_name=_("row counts"),
+        default=dict,
+        blank=True,
+        help_text=_("Number of imported rows by GTFS table."),
+    )
+    phases = models.JSONField(
+        verbose_name=_("phases"),
+        default=list,
+        blank=True,
+        help_text=_("Time, rows, queries and memory used by each phase of the import."),
+    )
+    bytes_written = models.BigIntegerField(
+        verbose_name=_("bytes written"),
+        null=True,
+        blank=True,
+        help_text=_("Amount of write-ahead log the import generated in the database."),
+    )
+    rows_per_second = models.FloatField(
+        verbose_name=_("rows per second"),
+        null=True,
+        blank=True,
+        help_text=_("Imported rows per second spent in the import phases."),
+    )
+
+    class Meta:
+        verbose_name = _("import run")
+        verbose_name_plural = _("import runs")
+        default_related_name = "import_runs"
+        ordering = ("-started_at",)
+        indexes = [models.Index(fields=["feed", "started_at"])]
+
+    def __str__(self):
+        return f"{self.feed} {self.started_at}"
+
+    @property
+    def duration(self):
+        return self.finished_at - self.started_at
+
+    def populate_rows_per_second(self):
+        seconds = sum(phase["seconds"] for phase in self.phases)
+        num_of_rows = sum(self.row_counts.values())
+        self.rows_per_second = (
+            num_of_rows / seconds if num_of_rows and seconds else None
+        )
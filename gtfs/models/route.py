@@ -1,4 +1,5 @@
 from django.contrib.gis.db import models
+from django.db.models import Min
 from django.utils.translation import gettext_lazy as _
 from parler.managers import TranslatableQuerySet
 from parler.models import TranslatableModel, TranslatedFields
@@ -8,12 +9,13 @@ from maas.models import MaasOperator
 from .agency import Agency
 from .base import GTFSModelWithSourceID
 from .feed import Feed
+from .stop import Stop
 
 
 class RouteQueryset(TranslatableQuerySet):
     def for_maas_operator(self, maas_operator: MaasOperator):
         feeds = Feed.objects.for_maas_operator(maas_operator)
-        return self.filter(feed__in=feeds)
+        return self.filter(feed__in=feeds.serving_feed_ids())
 
 
 class Route(TranslatableModel, GTFSModelWithSourceID):
@@ -60,6 +62,13 @@ class Route(TranslatableModel, GTFSModelWithSourceID):
         choices=CapacitySales.choices,
         default=CapacitySales.DISABLED,
     )
+    stops = models.ManyToManyField(
+        Stop,
+        verbose_name=_("stops"),
+        blank=True,
+        related_name="routes",
+        through="RouteStop",
+    )
 
     objects = RouteQueryset.as_manager()
 
@@ -72,3 +81,21 @@ class Route(TranslatableModel, GTFSModelWithSourceID):
         return self.safe_translation_getter(
             "long_name", default=super().__str__, any_language=True
         )
+
+    def populate_route_stops(self):
+        # the same as the importer does for a whole feed at once
+        route_stop_model = self.stops.through
+        self.route_stops.all().delete()
+        route_stop_model.objects.bulk_create(
+            route_stop_model(
+                feed_id=self.feed_id,
+                route=self,
+                stop_id=values["stop_times__stop_id"],
+                direction_id=values["direction_id"],
+                first_stop_sequence=values["first_stop_sequence"],
+            )
+            for values in self.trips.values(
+                "stop_times__stop_id", "direction_id"
+            ).annotate(first_stop_sequence=Min("stop_times__stop_sequence"))
+            if values["stop_times__stop_id"]
+        )
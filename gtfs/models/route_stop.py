@@ -0,0 +1,38 @@
+from django.contrib.gis.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import GTFSModel
+from .route import Route
+from .stop import Stop
+
+
+class RouteStop(GTFSModel):
+    """A stop served by a route, derived from the route's stop times.
+
+    Populated by the importer after the stop times, so that the stops of a route
+    can be found without going through the stop times.
+    """
+
+    route = models.ForeignKey(Route, verbose_name=_("route"), on_delete=models.CASCADE)
+    stop = models.ForeignKey(Stop, verbose_name=_("stop"), on_delete=models.CASCADE)
+    direction_id = models.PositiveSmallIntegerField(
+        verbose_name=_("direction ID"), blank=True, null=True
+    )
+    first_stop_sequence = models.PositiveIntegerField(
+        verbose_name=_("first stop sequence"),
+        help_text=_("The smallest stop sequence of the stop on the route's trips."),
+    )
+
+    class Meta:
+        verbose_name = _("route stop")
+        verbose_name_plural = _("route stops")
+        default_related_name = "route_stops"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["route", "stop", "direction_id"],
+                name="unique_route_stop_direction",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.route} | {self.direction_id} | {self.stop}"
@@ -10,7 +10,7 @@ from .feed import Feed
 class ShapeQueryset(models.QuerySet):
     def for_maas_operator(self, maas_operator: MaasOperator):
         feeds = Feed.objects.for_maas_operator(maas_operator)
-        return self.filter(feed__in=feeds)
+        return self.filter(feed__in=feeds.serving_feed_ids())
 
 
 class Shape(GTFSModelWithSourceID):
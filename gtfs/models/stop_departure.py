@@ -0,0 +1,55 @@
+from django.contrib.gis.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import GTFSModel
+from .route import Route
+from .stop import Stop
+from .stop_time import StopTime
+
+
+class StopDeparture(GTFSModel):
+    """A departure from a stop on a date, derived from a departure and a stop time.
+
+    Populated by the importer after the departures, so that the departures of a
+    stop on a date can be read from a single index without joining the trips and
+    resolving the times in the agency's timezone.
+    """
+
+    departure = models.ForeignKey(
+        "Departure", verbose_name=_("departure"), on_delete=models.CASCADE
+    )
+    # a copy of the departure's API ID, so that it can be served without a join
+    api_id = models.UUIDField(verbose_name=_("API ID"))
+    stop_time = models.ForeignKey(
+        StopTime, verbose_name=_("stop time"), on_delete=models.CASCADE
+    )
+    stop = models.ForeignKey(Stop, verbose_name=_("stop"), on_delete=models.CASCADE)
+    route = models.ForeignKey(Route, verbose_name=_("route"), on_delete=models.CASCADE)
+    date = models.DateField(verbose_name=_("date"))
+    direction_id = models.PositiveSmallIntegerField(
+        verbose_name=_("direction ID"), blank=True, null=True
+    )
+    stops_after_this = models.PositiveSmallIntegerField(
+        verbose_name=_("stops after this"), null=True, blank=True
+    )
+    arrival_time = models.DateTimeField(
+        verbose_name=_("arrival time"), null=True, blank=True
+    )
+    departure_time = models.DateTimeField(
+        verbose_name=_("departure time"), null=True, blank=True
+    )
+
+    class Meta:
+        verbose_name = _("stop departure")
+        verbose_name_plural = _("stop departures")
+        default_related_name = "stop_departures"
+        indexes = [models.Index(fields=["stop", "date", "departure_time"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["departure", "stop_time"],
+                name="unique_departure_stop_time",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.departure} {self.stop_time}"
@@ -48,7 +48,7 @@ class Trip(TranslatableModel, GTFSModelWithSourceID):
     )
     block_id = models.CharField(verbose_name=_("block ID"), max_length=255, blank=True)
 
-    class Meta:
+    class Meta(GTFSModelWithSourceID.Meta):
         verbose_name = _("trip")
         verbose_name_plural = _("trips")
         default_related_name = "trips"
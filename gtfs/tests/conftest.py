@@ -6,6 +6,7 @@ import pytest
 from model_bakery import baker, seq
 from rest_framework.test import APIClient
 
+from gtfs.importers import GTFSFeedImporter
 from gtfs.models import Agency, Departure, Route, Stop, StopTime, Trip
 from gtfs.tests.utils import get_feed_for_maas_operator
 from maas.models import MaasOperator
@@ -143,5 +144,7 @@ def route_with_departures(api_id_generator, route_for_maas_operator):
 
     for trip in trips:
         trip.populate_stop_times_stops_after_this()
+    route.populate_route_stops()
+    GTFSFeedImporter().populate_stop_departures(route.feed)
 
     return route
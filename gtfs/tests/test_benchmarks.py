@@ -0,0 +1,59 @@
+import logging
+from timeit import default_timer as timer
+
+import pytest
+
+from gtfs.importers import GTFSFeedImporter
+from gtfs.models import Agency, Departure, Feed, Route, Trip
+from gtfs.tests.utils import build_year_long_gtfs_feed, import_translatable_objects
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+@pytest.mark.parametrize("load_engine", GTFSFeedImporter.LOAD_ENGINES)
+def test_departure_creation_benchmark(load_engine):
+    num_of_trips = 200
+    feed = Feed.objects.create(name="Benchmark feed", url_or_path="benchmark")
+    gtfs_feed = build_year_long_gtfs_feed(num_of_trips)
+    importer = GTFSFeedImporter(load_engine=load_engine)
+    for model, gtfs_attribute in (
+        (Agency, "agency"),
+        (Route, "routes"),
+        (Trip, "trips"),
+    ):
+        importer._import_model(feed, model, getattr(gtfs_feed, gtfs_attribute))
+
+    start_time = timer()
+    importer._create_departures(feed, gtfs_feed)
+    elapsed = timer() - start_time
+
+    num_of_departures = Departure.objects.filter(trip__feed=feed).count()
+    assert num_of_departures == num_of_trips * 365
+
+    logger.info(
+        f"[{load_engine}] Created {num_of_departures} departures "
+        f"in {elapsed:.2f} secs ({num_of_departures / elapsed:.0f} departures/s)"
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+@pytest.mark.parametrize("num_of_records", [100, 1000, 5000])
+def test_translation_benchmark(num_of_records):
+    # the number of queries is checked in test_importers
+    importer, feed, translation_index = import_translatable_objects(num_of_records)
+
+    start_time = timer()
+    num_of_translations = 0
+    for model, gtfs_attribute in importer.MODELS_AND_GTFS_KIT_ATTRIBUTES:
+        num_of_translations += importer._add_translations(
+            model, gtfs_attribute, translation_index, feed
+        )
+    elapsed = timer() - start_time
+
+    logger.info(
+        f"Added {num_of_translations} translations in {elapsed:.2f} secs "
+        f"({num_of_translations / elapsed:.0f} translations/s)"
+    )
@@ -1,22 +1,46 @@
 import datetime
+import hashlib
+import shutil
+import tracemalloc
 from decimal import Decimal
+from pathlib import Path
 
+import pandas as pd
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import localdate
+from model_bakery import baker
 
 from gtfs.importers import GTFSFeedImporter, GTFSFeedUpdater
+from gtfs.importers.gtfs_feed_collector import GTFSFeedCollector
+from gtfs.importers.gtfs_feed_importer import GTFSFeedImporterError
+from gtfs.importers.gtfs_feed_reader import (
+    get_extra_row_class,
+    GTFSFeedReader,
+    validate_extra_dataset,
+)
+from gtfs.importers.import_profiler import ImportProfiler
 from gtfs.models import (
     Agency,
+    Departure,
     Fare,
+    FareRiderCategory,
+    FareRule,
     Feed,
     FeedInfo,
+    ImportRun,
     RiderCategory,
     Route,
+    RouteStop,
     Shape,
     Stop,
+    StopDeparture,
     StopTime,
     Trip,
 )
+from gtfs.tests.utils import get_feed_for_maas_operator, import_translatable_objects
+from maas.models import TicketingSystem
 
 
 @pytest.mark.django_db
@@ -72,6 +96,13 @@ def test_gtfs_feed_importer():
     assert stop_time_2.stop_sequence == 2
     assert stop_time_2.timepoint == StopTime.Timepoint.APPROXIMATE
     assert stop_time_2.stops_after_this == 0
+    assert set(route.stops.all()) == set(
+        Stop.objects.filter(stop_times__trip__route=route)
+    )
+    route_stop = route.route_stops.get(
+        stop=stop_time.stop, direction_id=trip.direction_id
+    )
+    assert route_stop.first_stop_sequence == 1
 
     stop = stop_time.stop
     assert stop.name == "Kauppatori - Lyypekinlaituri"
@@ -126,6 +157,438 @@ def test_gtfs_feed_importer():
     assert Shape.objects.count() == 3
     assert len(trip.shape.geometry) == 9
 
+    departure = trip.departures.first()
+    api_id = departure.api_id
+    departure.populate_api_id()
+    assert departure.api_id == api_id
+
+    stop_departure = StopDeparture.objects.get(
+        stop_time=stop_time_2, date=departure.date
+    )
+    assert stop_departure.api_id == departure.api_id
+    assert stop_departure.stop == stop_time_2.stop
+    assert stop_departure.stops_after_this == 0
+    assert stop_departure.arrival_time == stop_time_2.get_arrival_time_datetime(
+        departure
+    )
+    assert stop_departure.departure_time == stop_time_2.get_departure_time_datetime(
+        departure
+    )
+
+
+def get_imported_data(feed):
+    data = {}
+    for model in (Agency, Fare, RiderCategory, Route, Shape, Stop, Trip):
+        data[model] = sorted(
+            model.objects.filter(feed=feed).values_list("source_id", "api_id")
+        )
+        if translation_model := getattr(model, "translations", None):
+            translation_model = translation_model.rel.related_model
+            fields = [
+                f.attname
+                for f in translation_model._meta.concrete_fields
+                if f.name not in ("id", "master")
+            ]
+            data[translation_model] = sorted(
+                translation_model.objects.filter(master__feed=feed).values_list(
+                    "master__source_id", *fields
+                ),
+                key=str,
+            )
+    data[StopTime] = sorted(
+        StopTime.objects.filter(feed=feed).values_list(
+            "trip__source_id",
+            "stop__source_id",
+            "stop_sequence",
+            "arrival_time",
+            "departure_time",
+            "timepoint",
+            "stops_after_this",
+            "translations__language_code",
+            "translations__stop_headsign",
+        ),
+        key=str,
+    )
+    data[RouteStop] = sorted(
+        RouteStop.objects.filter(feed=feed).values_list(
+            "route__source_id",
+            "stop__source_id",
+            "direction_id",
+            "first_stop_sequence",
+        ),
+        key=str,
+    )
+    data[FareRule] = sorted(
+        FareRule.objects.filter(feed=feed).values_list(
+            "fare__source_id", "route__source_id"
+        ),
+        key=str,
+    )
+    data[FareRiderCategory] = sorted(
+        FareRiderCategory.objects.filter(feed=feed).values_list(
+            "fare__source_id", "rider_category__source_id", "price", "currency_type"
+        )
+    )
+    data[FeedInfo] = list(
+        FeedInfo.objects.filter(feed=feed).values_list(
+            "publisher_name", "lang", "start_date", "end_date"
+        )
+    )
+    data[Departure] = sorted(
+        Departure.objects.filter(trip__feed=feed).values_list(
+            "api_id", "trip__source_id", "date"
+        )
+    )
+    data[StopDeparture] = sorted(
+        StopDeparture.objects.filter(feed=feed).values_list(
+            "api_id",
+            "stop_time__trip__source_id",
+            "stop_time__stop_sequence",
+            "stop__source_id",
+            "route__source_id",
+            "date",
+            "direction_id",
+            "stops_after_this",
+            "arrival_time",
+            "departure_time",
+        )
+    )
+    data["geometries"] = sorted(
+        (shape.source_id, shape.geometry.coords)
+        for shape in Shape.objects.filter(feed=feed)
+    )
+    data["points"] = sorted(
+        (stop.source_id, stop.point.coords) for stop in Stop.objects.filter(feed=feed)
+    )
+    return data
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_copy_engine():
+    feed = Feed.objects.create(
+        name="Test feed", url_or_path="gtfs/tests/data/gtfs_test_feed"
+    )
+    GTFSFeedImporter().run(feed)
+    orm_data = get_imported_data(feed)
+
+    GTFSFeedImporter(load_engine=GTFSFeedImporter.LOAD_ENGINE_COPY).run(feed)
+
+    copy_data = get_imported_data(feed)
+    assert copy_data[Departure]
+    assert copy_data == orm_data
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_chunks():
+    feed = Feed.objects.create(
+        name="Test feed", url_or_path="gtfs/tests/data/gtfs_test_feed"
+    )
+    GTFSFeedImporter().run(feed)
+    data = get_imported_data(feed)
+
+    GTFSFeedImporter(chunk_size=3).run(feed)
+
+    chunked_data = get_imported_data(feed)
+    assert chunked_data[StopTime]
+    assert chunked_data["geometries"]
+    assert chunked_data == data
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_staging(maas_operator):
+    feed = get_feed_for_maas_operator(maas_operator, True)
+    feed.url_or_path = "gtfs/tests/data/gtfs_test_feed"
+    GTFSFeedImporter().run(feed)
+    data = get_imported_data(feed)
+
+    GTFSFeedImporter(staging=True).run(feed)
+
+    feed.refresh_from_db()
+    version = feed.serving_version
+    assert version.version_of == feed
+    assert version.ticketing_system == feed.ticketing_system
+    # the version has the same API IDs, and the old data is kept until collected
+    assert get_imported_data(version) == data
+    assert get_imported_data(feed) == data
+    served_routes = Route.objects.for_maas_operator(maas_operator)
+    assert {route.feed_id for route in served_routes} == {version.id}
+    assert list(Feed.objects.for_maas_operator(maas_operator)) == [feed]
+
+    GTFSFeedImporter(staging=True).run(feed)
+    feed.refresh_from_db()
+    new_version = feed.serving_version
+    GTFSFeedCollector(batch_size=2).collect()
+
+    assert list(feed.versions.all()) == [new_version]
+    assert not Route.objects.filter(feed=feed).exists()
+    assert not Departure.objects.filter(trip__feed=feed).exists()
+    assert get_imported_data(new_version) == data
+
+
+@pytest.mark.django_db
+def test_feed_ticketing_system_is_copied_to_versions(
+    maas_operator, django_assert_num_queries
+):
+    feed = get_feed_for_maas_operator(maas_operator, True)
+    version = baker.make(Feed, version_of=feed, ticketing_system=feed.ticketing_system)
+    ticketing_system = baker.make(TicketingSystem)
+
+    feed.name = "feed"
+
+    # saves that don't change the ticketing system don't touch the versions
+    with django_assert_num_queries(1):
+        feed.save()
+    feed.ticketing_system = ticketing_system
+    feed.save()
+
+    version.refresh_from_db()
+    assert version.ticketing_system == ticketing_system
+
+    # loading a feed without its ticketing system doesn't fetch it
+    with django_assert_num_queries(1):
+        Feed.objects.only("name").get(pk=feed.pk)
+
+
+def test_gtfs_feed_importer_chunks_need_ordered_table(tmp_path):
+    feed_path = tmp_path / "gtfs_test_feed"
+    shutil.copytree("gtfs/tests/data/gtfs_test_feed", feed_path)
+    shapes_file = feed_path / "shapes.txt"
+    header, *lines = shapes_file.read_text().splitlines()
+    # interleave the points of different shapes
+    shapes_file.write_text("\n".join([header, *lines[::2], *lines[1::2]]))
+    importer = GTFSFeedImporter(chunk_size=3)
+    feed_data = importer.read(Feed(url_or_path=str(feed_path)))
+
+    with pytest.raises(GTFSFeedImporterError, match="ordered by shape_id"):
+        list(importer._read_table(feed_data, "shapes"))
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_profile():
+    feed = Feed.objects.create(
+        name="Test feed", url_or_path="gtfs/tests/data/gtfs_test_feed"
+    )
+    GTFSFeedImporter(trace_memory=True).run(feed)
+
+    feed.refresh_from_db()
+    phases = {phase["name"]: phase for phase in feed.import_profile}
+    assert list(phases)[:4] == ["read", "validate", "delete", "import shapes"]
+    assert {"departures", "stops_after_this", "translations"} <= phases.keys()
+    assert phases["import stop_times"]["rows"] == StopTime.objects.count()
+    assert phases["route stops"]["rows"] == RouteStop.objects.count()
+    assert phases["stop departures"]["rows"] == StopDeparture.objects.count()
+    assert phases["departures"]["rows"] == Departure.objects.count()
+    assert phases["import stop_times"]["queries"] > 0
+    assert all(
+        phase["max_rss_increase"] >= 0 and phase["peak_memory"]
+        for phase in phases.values()
+    )
+    # the memory is traced only during the phases
+    assert not tracemalloc.is_tracing()
+
+
+def test_import_profiler_accumulates_phases():
+    profiler = ImportProfiler()
+    for rows in (2, 3):
+        with profiler.phase("import stop_times") as phase:
+            phase.rows += rows
+
+    profiler.reset(profiler.as_list())
+    with profiler.phase("departures"):
+        pass
+
+    assert [(p["name"], p["rows"]) for p in profiler.as_list()] == [
+        ("import stop_times", 5),
+        ("departures", 0),
+    ]
+    assert profiler.as_list()[0]["peak_memory"] is None
+    assert "import stop_times" in profiler.get_report()
+
+
+def test_import_profiler_counts_copies():
+    profiler = ImportProfiler(trace_memory=True)
+    profiler.count_query()
+    with profiler.phase("import stop_times") as phase:
+        profiler.count_query()
+        assert tracemalloc.is_tracing()
+
+    assert phase.queries == 1
+    assert phase.peak_memory is not None
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_incremental(tmp_path):
+    feed_path = tmp_path / "gtfs_test_feed"
+    shutil.copytree("gtfs/tests/data/gtfs_test_feed", feed_path)
+    feed = Feed.objects.create(name="Test feed", url_or_path=str(feed_path))
+    GTFSFeedImporter().run(feed)
+    full_data = get_imported_data(feed)
+    trip_ids = dict(Trip.objects.values_list("source_id", "id"))
+    stop_time_ids = set(StopTime.objects.values_list("id", flat=True))
+    stop_departure_trips = dict(
+        StopDeparture.objects.values_list("id", "stop_time__trip__source_id")
+    )
+
+    importer = GTFSFeedImporter(incremental=True)
+    importer.run(feed)
+
+    # nothing has changed
+    assert get_imported_data(feed) == full_data
+    assert dict(Trip.objects.values_list("source_id", "id")) == trip_ids
+    assert set(StopTime.objects.values_list("id", flat=True)) == stop_time_ids
+    assert (
+        dict(StopDeparture.objects.values_list("id", "stop_time__trip__source_id"))
+        == stop_departure_trips
+    )
+
+    # remove a trip, change a trip's time, rename a stop and remove a translation
+    for filename, old, new in (
+        ("trips.txt", "vallisaari_rengas_2", None),
+        ("stop_times.txt", "vallisaari_rengas_2", None),
+        (
+            "stop_times.txt",
+            "kauppatori_vallisaari_2,09:20:00,09:20:00",
+            "kauppatori_vallisaari_2,09:25:00,09:25:00",
+        ),
+        ("stops.txt", "lonna,Lonna,", "lonna,Lonnan saari,"),
+        ("translations.txt", "Skanslandet rutt", None),
+    ):
+        path = feed_path / filename
+        lines = path.read_text().splitlines(keepends=True)
+        path.write_text(
+            "".join(
+                line.replace(old, new) if new else line
+                for line in lines
+                if new or old not in line
+            )
+        )
+    importer.run(feed)
+
+    incremental_data = get_imported_data(feed)
+    del trip_ids["vallisaari_rengas_2"]
+    assert dict(Trip.objects.values_list("source_id", "id")) == trip_ids
+    assert Stop.objects.get(source_id="lonna").name == "Lonnan saari"
+    route = Route.objects.get()
+    assert not route.has_translation("sv")
+    assert Departure.objects.filter(trip__source_id="vallisaari_rengas_2").count() == 0
+    # only the stop departures of the changed trip are rebuilt, the removed trip's
+    # are deleted and the rest are kept as they were
+    changed_trips = {"kauppatori_vallisaari_2", "vallisaari_rengas_2"}
+    new_stop_departure_trips = dict(
+        StopDeparture.objects.values_list("id", "stop_time__trip__source_id")
+    )
+    assert {
+        pk: trip
+        for pk, trip in new_stop_departure_trips.items()
+        if trip not in changed_trips
+    } == {
+        pk: trip
+        for pk, trip in stop_departure_trips.items()
+        if trip not in changed_trips
+    }
+    assert new_stop_departure_trips.keys().isdisjoint(
+        pk
+        for pk, trip in stop_departure_trips.items()
+        if trip == "kauppatori_vallisaari_2"
+    )
+    assert "vallisaari_rengas_2" not in new_stop_departure_trips.values()
+
+    # the result must match a complete import
+    GTFSFeedImporter().run(feed)
+    assert get_imported_data(feed) == incremental_data
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_stop_time_translations(django_assert_max_num_queries):
+    feed = Feed.objects.create(
+        name="Test feed", url_or_path="gtfs/tests/data/gtfs_test_feed"
+    )
+    importer = GTFSFeedImporter()
+    importer.run(feed)
+
+    stop_times = StopTime.objects.filter(feed=feed).select_related("trip")
+    translations = pd.DataFrame(
+        [
+            {
+                "table_name": "stop_times",
+                "field_name": "stop_headsign",
+                "language": language,
+                "translation": f"{stop_time.stop_sequence} {language}",
+                "record_id": stop_time.trip.source_id,
+                "record_sub_id": str(stop_time.stop_sequence),
+            }
+            for stop_time in stop_times
+            for language in ("fi", "en", "sv")
+        ]
+    )
+
+    # the number of queries must not depend on the number of translations
+    with django_assert_max_num_queries(10):
+        importer._add_translations(
+            StopTime,
+            "stop_times",
+            importer._form_translation_index(translations),
+            feed,
+        )
+
+    for stop_time in stop_times:
+        for language in ("fi", "en", "sv"):
+            stop_time.set_current_language(language)
+            assert stop_time.stop_headsign == f"{stop_time.stop_sequence} {language}"
+
+
+@pytest.mark.django_db
+def test_gtfs_feed_importer_translation_queries():
+    num_of_queries = []
+    for num_of_records in (10, 100):
+        importer, feed, translation_index = import_translatable_objects(num_of_records)
+
+        num_of_translations = 0
+        with CaptureQueriesContext(connection) as context:
+            for model, gtfs_attribute in importer.MODELS_AND_GTFS_KIT_ATTRIBUTES:
+                num_of_translations += importer._add_translations(
+                    model, gtfs_attribute, translation_index, feed
+                )
+        num_of_queries.append(len(context.captured_queries))
+
+        # a route, and the trips and stops in two languages
+        assert num_of_translations == 2 * (1 + 2 * num_of_records)
+        translated_stops = Stop.objects.filter(
+            feed=feed, translations__language_code="sv"
+        )
+        assert translated_stops.count() == num_of_records
+
+    # the number of queries must not depend on the number of translations
+    assert num_of_queries[0] == num_of_queries[1]
+
+
+def get_test_feed_archive(tmp_path):
+    archive = shutil.make_archive(
+        str(tmp_path / "gtfs_test_feed"), "zip", "gtfs/tests/data/gtfs_test_feed"
+    )
+    return Path(archive).read_bytes()
+
+
+def test_gtfs_feed_reader_downloads_feed_once(requests_mock, tmp_path):
+    content = get_test_feed_archive(tmp_path)
+    url = "https://example.com/gtfs.zip"
+    requests_mock.head(url)
+    requests_mock.get(url, content=content)
+    reader = GTFSFeedReader()
+
+    fingerprint = reader.get_feed_fingerprint(Feed(url_or_path=url))
+    gtfs_feed = reader.read_feed(url)
+
+    assert fingerprint == hashlib.sha1(content).hexdigest()
+    assert len(gtfs_feed.routes) == 1
+    assert len(gtfs_feed.translations) == 5
+    assert [r.method for r in requests_mock.request_history] == ["GET"]
+
+    path = reader.downloads[url].path
+    reader.cleanup()
+    assert not path.exists()
+
 
 @pytest.mark.django_db
 def test_feed_updater():
@@ -166,3 +629,203 @@ def test_feed_updater():
     feed.refresh_from_db()
     assert feed.imported_at and feed.imported_at == feed.import_attempted_at
     assert feed.last_import_successful
+
+
+@pytest.mark.django_db
+def test_feed_updater_workers():
+    feed = Feed.objects.create(url_or_path="gtfs/tests/data/gtfs_test_feed")
+    failing_feed = Feed.objects.create(url_or_path="failure-path")
+
+    GTFSFeedUpdater().update_feeds(workers=2)
+
+    feed.refresh_from_db()
+    failing_feed.refresh_from_db()
+    assert feed.last_import_successful
+    assert feed.imported_at and feed.imported_at == feed.import_attempted_at
+    assert Agency.objects.filter(feed=feed).count() == 1
+    assert failing_feed.last_import_successful is False
+    assert "Error reading GTFS feed" in failing_feed.last_import_error_message
+
+
+@pytest.mark.django_db
+def test_feed_updater_import_runs():
+    feed = Feed.objects.create(url_or_path="gtfs/tests/data/gtfs_test_feed")
+    updater = GTFSFeedUpdater()
+
+    updater.update_feeds()
+    # an unchanged feed isn't imported, so there's no run
+    updater.update_feeds()
+    feed.url_or_path = "failure-path"
+    feed.fingerprint = ""
+    feed.save()
+    updater.update_feeds()
+
+    successful_run, failed_run = ImportRun.objects.filter(feed=feed).order_by(
+        "started_at"
+    )
+    assert successful_run.successful
+    assert successful_run.fingerprint == localdate().isoformat()
+    assert successful_run.started_at < successful_run.finished_at
+    assert successful_run.row_counts["stop_times"] == StopTime.objects.count()
+    assert successful_run.row_counts["departures"] == Departure.objects.count()
+    assert successful_run.phases[0]["name"] == "read"
+    assert successful_run.rows_per_second > 0
+    assert successful_run.bytes_written > 0
+    assert not failed_run.successful
+    assert "Error reading GTFS feed" in failed_run.error_message
+    assert failed_run.row_counts == {}
+    assert failed_run.rows_per_second is None
+
+
+@pytest.mark.django_db
+def test_feed_updater_conditional_requests(requests_mock, settings, tmp_path):
+    settings.GTFS_FEED_CACHE_ROOT = tmp_path / "cache"
+    content = get_test_feed_archive(tmp_path)
+    url = "https://example.com/gtfs.zip"
+    requests_mock.get(
+        url,
+        [
+            {"content": content, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+    feed = Feed.objects.create(url_or_path=url)
+    updater = GTFSFeedUpdater()
+
+    updater.update_feeds()
+    feed.refresh_from_db()
+    assert feed.last_import_successful
+    assert feed.fingerprint == hashlib.sha1(content).hexdigest()
+    assert feed.etag == '"v1"'
+    assert requests_mock.call_count == 1
+    imported_at = feed.imported_at
+
+    # an unchanged feed costs a single conditional request
+    updater.update_feeds()
+    feed.refresh_from_db()
+    assert feed.imported_at == imported_at
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+    # a forced update uses the cached archive
+    updater.update_feeds(force=True)
+    feed.refresh_from_db()
+    assert feed.imported_at > imported_at
+    assert feed.last_import_successful
+    assert feed.etag == '"v1"'
+    assert requests_mock.call_count == 3
+    assert Agency.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_feed_updater_unchanged_feed_without_etag(requests_mock, settings, tmp_path):
+    settings.GTFS_FEED_CACHE_ROOT = tmp_path / "cache"
+    url = "https://example.com/gtfs.zip"
+    last_modified = "Wed, 21 Oct 2020 07:28:00 GMT"
+    requests_mock.get(
+        url,
+        [
+            {
+                "content": get_test_feed_archive(tmp_path),
+                "headers": {"ETag": '"v1"', "Last-Modified": last_modified},
+            },
+            {"status_code": 304},
+        ],
+    )
+    # imported before the ETag and Last-Modified were stored
+    feed = Feed.objects.create(url_or_path=url, fingerprint=last_modified)
+    updater = GTFSFeedUpdater()
+
+    updater.update_feeds()
+    feed.refresh_from_db()
+    # the feed wasn't transferred nor imported
+    assert not settings.GTFS_FEED_CACHE_ROOT.exists()
+    assert feed.imported_at is None
+    assert feed.last_import_successful
+    assert feed.etag == '"v1"'
+    assert feed.last_modified == last_modified
+
+    # the next update is a real conditional request
+    updater.update_feeds()
+    feed.refresh_from_db()
+    assert feed.imported_at is None
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert requests_mock.last_request.headers["If-Modified-Since"] == last_modified
+
+
+def test_gtfs_feed_reader_reads_extra_files_from_zip(tmp_path):
+    feed_dir = tmp_path / "feed"
+    shutil.copytree("gtfs/tests/data/gtfs_test_feed", feed_dir)
+    # a byte order mark shouldn't end up in the first header
+    translations = feed_dir / "translations.txt"
+    translations.write_bytes(b"\xef\xbb\xbf" + translations.read_bytes())
+    archive = shutil.make_archive(str(tmp_path / "feed"), "zip", feed_dir)
+    reader = GTFSFeedReader()
+
+    extra_data = reader._read_feed_extra_from_path(archive)
+
+    assert extra_data == reader._read_feed_extra_from_path(
+        "gtfs/tests/data/gtfs_test_feed"
+    )
+    assert extra_data["translations"][0].table_name == "routes"
+
+
+def test_gtfs_feed_reader_dtypes():
+    gtfs_feed = GTFSFeedReader().read_feed("gtfs/tests/data/gtfs_test_feed")
+
+    assert gtfs_feed.stop_times["trip_id"].dtype == "category"
+    assert gtfs_feed.stop_times["stop_sequence"].dtype == "Int64"
+    # missing values don't turn integers into floats
+    assert gtfs_feed.stop_times["timepoint"].dtype == "Int64"
+    assert gtfs_feed.stop_times["timepoint"].isna().any()
+    timepoints = GTFSFeedImporter._convert_int_column(gtfs_feed.stop_times["timepoint"])
+    assert timepoints[:2] == [None, 0]
+
+
+def test_gtfs_feed_reader_rounds_non_integral_integers(tmp_path):
+    feed_path = tmp_path / "gtfs_test_feed"
+    shutil.copytree("gtfs/tests/data/gtfs_test_feed", feed_path)
+    stop_times = feed_path / "stop_times.txt"
+    stop_times.write_text(
+        stop_times.read_text().replace(
+            "kauppatori_vallisaari_1,24:00:00,25:30:00,vallisaari_tulo,2,,0",
+            "kauppatori_vallisaari_1,24:00:00,25:30:00,vallisaari_tulo,2.2,,0.6",
+        )
+    )
+    reader = GTFSFeedReader()
+
+    gtfs_feed = reader.read_feed(feed_path)
+    (chunk, *_chunks) = reader.read_table_chunks(
+        feed_path, "stop_times", chunk_size=2, group_column="trip_id"
+    )
+
+    for stop_times in (gtfs_feed.stop_times, chunk):
+        assert stop_times["stop_sequence"].dtype == "Int64"
+        assert stop_times["stop_sequence"].tolist()[:2] == [1, 2]
+        assert stop_times["timepoint"].tolist()[1] == 1
+
+
+@pytest.mark.parametrize(
+    "price", ["4.50", "004.5", ".5", "4.505", "123456789", "1e2", "abc", ""]
+)
+@pytest.mark.parametrize("currency_type", ["EUR", " ", "EURO"])
+def test_gtfs_feed_reader_validates_extra_datasets(price, currency_type):
+    serializer = GTFSFeedReader.EXTRA_FILES["fare_rider_categories"]
+    row_class = get_extra_row_class("fare_rider_categories", tuple(serializer().fields))
+    dataset = [
+        row_class("fare", "adult", "4.50", "EUR"),
+        row_class("fare", "child", price, currency_type),
+    ]
+    expected_problems = []
+    for row_index, row in enumerate(dataset, 1):
+        validator = serializer(data=row._asdict())
+        if not validator.is_valid():
+            expected_problems.append(
+                ["error", validator.errors, "fare_rider_categories", row_index]
+            )
+
+    assert (
+        validate_extra_dataset("fare_rider_categories", serializer, dataset)
+        == expected_problems
+    )
@@ -1,8 +1,13 @@
 import json
+from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker, seq
 
+from gtfs.importers import GTFSFeedImporter
 from gtfs.models import (
     Fare,
     FareRiderCategory,
@@ -39,6 +44,7 @@ def test_routes_with_stop_id(maas_api_client):
     trip = baker.make(Trip, route=routes[0], feed=feed)
     stop = baker.make(Stop, feed=feed)
     baker.make(StopTime, trip=trip, stop=stop, feed=feed)
+    routes[0].populate_route_stops()
 
     url = f"{ENDPOINT}?stop_id={stop.api_id}"
 
@@ -94,6 +100,78 @@ def test_routes_departures(maas_api_client, snapshot, filters, route_with_depart
             assert "departures" not in stop_content
 
 
+@pytest.mark.django_db
+def test_route_departures_num_of_queries(maas_api_client, route_with_departures):
+    def get_num_of_queries():
+        url = ENDPOINT + f"{route_with_departures.api_id}/"
+        # measure with a cold cache, parler caches the translations it looks up
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = maas_api_client.get(url, {"date": "2021-02-18"})
+        assert response.status_code == 200
+        return len(context.captured_queries), len(response.data["stops"])
+
+    num_of_queries, num_of_stops = get_num_of_queries()
+    trip = route_with_departures.trips.first()
+    baker.make(
+        StopTime,
+        trip=trip,
+        stop=iter(baker.make(Stop, feed=trip.feed, _quantity=5)),
+        feed=trip.feed,
+        arrival_time=timedelta(hours=20),
+        departure_time=timedelta(hours=20),
+        stop_sequence=seq(10),
+        _quantity=5,
+    )
+    route_with_departures.populate_route_stops()
+    GTFSFeedImporter().populate_stop_departures(trip.feed)
+
+    assert get_num_of_queries() == (num_of_queries, num_of_stops + 5)
+
+
+@pytest.mark.django_db
+def test_routes_num_of_queries(maas_api_client):
+    feed = get_feed_for_maas_operator(maas_api_client.maas_operator, True)
+
+    def make_route():
+        route = baker.make(Route, feed=feed, long_name="route")
+        trip = baker.make(Trip, route=route, feed=feed)
+        baker.make(
+            StopTime,
+            trip=trip,
+            stop=iter(baker.make(Stop, feed=feed, _quantity=2)),
+            feed=feed,
+            _quantity=2,
+        )
+        route.populate_route_stops()
+        fare = baker.make(Fare, feed=feed)
+        baker.make(FareRule, feed=feed, fare=fare, route=route)
+        baker.make(
+            FareRiderCategory,
+            feed=feed,
+            fare=fare,
+            rider_category=baker.make(
+                RiderCategory, feed=feed, name="name", description="description"
+            ),
+        )
+
+    def get_num_of_queries():
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = maas_api_client.get(ENDPOINT)
+        assert response.status_code == 200
+        return len(context.captured_queries), len(response.data)
+
+    # a single route's translations aren't prefetched, so start from two
+    make_route()
+    make_route()
+    num_of_queries, _num_of_routes = get_num_of_queries()
+    make_route()
+    make_route()
+
+    assert get_num_of_queries() == (num_of_queries, 4)
+
+
 @pytest.mark.django_db
 def test_route_ordering(maas_api_client):
     feed = get_feed_for_maas_operator(maas_api_client.maas_operator, True)
@@ -7,6 +7,7 @@ import pytest
 from django.contrib.gis.geos import Point
 from model_bakery import baker, seq
 
+from gtfs.importers import GTFSFeedImporter
 from gtfs.models import Departure, Stop, StopTime, Trip
 from gtfs.tests.utils import clean_stops_for_snapshot, get_feed_for_maas_operator
 
@@ -160,6 +161,7 @@ def test_stops_departures__stop_appears_multiple_times_in_trip(
         trip=trip,
         date=date(2021, 2, 18),
     )
+    GTFSFeedImporter().populate_stop_departures(trip.feed)
 
     with django_assert_max_num_queries(5):
         response = maas_api_client.get(
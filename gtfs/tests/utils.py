@@ -1,8 +1,11 @@
 from copy import deepcopy
 
+import gtfs_kit
+import pandas as pd
 from model_bakery import baker
 
-from gtfs.models import Feed
+from gtfs.importers import GTFSFeedImporter
+from gtfs.models import Agency, Feed, Route, Stop, Trip
 from maas.models import TicketingSystem, TransportServiceProvider
 
 
@@ -39,3 +42,114 @@ def clean_shape_for_snapshot(shape):
 
 def clean_shapes_for_snapshot(shapes):
     return [clean_shape_for_snapshot(s) for s in shapes]
+
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def build_year_long_gtfs_feed(num_of_trips):
+    """Build a feed in which every trip runs daily for the whole year 2021."""
+    return gtfs_kit.Feed(
+        dist_units="km",
+        agency=pd.DataFrame(
+            {
+                "agency_id": ["benchmark_agency"],
+                "agency_name": ["Benchmark agency"],
+                "agency_url": ["https://benchmark.agency"],
+                "agency_timezone": ["Europe/Helsinki"],
+            }
+        ),
+        routes=pd.DataFrame(
+            {
+                "route_id": ["benchmark_route"],
+                "agency_id": ["benchmark_agency"],
+                "route_short_name": ["benchmark"],
+                "route_long_name": ["Benchmark route"],
+                "route_type": [4],
+            }
+        ),
+        trips=pd.DataFrame(
+            {
+                "route_id": "benchmark_route",
+                "service_id": "daily",
+                "trip_id": [f"benchmark_trip_{i}" for i in range(num_of_trips)],
+            }
+        ),
+        calendar=pd.DataFrame(
+            {
+                "service_id": ["daily"],
+                **{weekday: [1] for weekday in WEEKDAYS},
+                "start_date": ["20210101"],
+                "end_date": ["20211231"],
+            }
+        ),
+    )
+
+
+def build_stops(num_of_stops):
+    return pd.DataFrame(
+        {
+            "stop_id": [f"benchmark_stop_{i}" for i in range(num_of_stops)],
+            "stop_name": [f"Benchmark stop {i}" for i in range(num_of_stops)],
+            "stop_lat": 60.0,
+            "stop_lon": 25.0,
+        }
+    )
+
+
+def build_translations(gtfs_feed, stops):
+    return pd.DataFrame(
+        [
+            {
+                "table_name": table_name,
+                "field_name": field_name,
+                "language": language,
+                "translation": f"{record_id} {language}",
+                "record_id": record_id,
+                "record_sub_id": "",
+            }
+            for table_name, field_name, record_ids in (
+                ("routes", "route_long_name", gtfs_feed.routes["route_id"]),
+                ("trips", "trip_headsign", gtfs_feed.trips["trip_id"]),
+                ("stops", "stop_name", stops["stop_id"]),
+            )
+            for record_id in record_ids
+            for language in ("en", "sv")
+        ]
+    )
+
+
+def import_translatable_objects(num_of_records):
+    """Import a route, and trips and stops, and index translations for them.
+
+    The route, the trips and the stops have translations in two languages. Returns
+    the importer, the feed and the translation index.
+    """
+    feed = Feed.objects.create(
+        name=f"Translated feed {num_of_records}",
+        url_or_path=f"translated_{num_of_records}",
+    )
+    gtfs_feed = build_year_long_gtfs_feed(num_of_records)
+    stops = build_stops(num_of_records)
+    # a single batch, so that the number of queries doesn't depend on the number of
+    # translations
+    importer = GTFSFeedImporter(object_creation_batch_size=2 * num_of_records)
+    for model, gtfs_data in (
+        (Agency, gtfs_feed.agency),
+        (Route, gtfs_feed.routes),
+        (Trip, gtfs_feed.trips),
+        (Stop, stops),
+    ):
+        importer._import_model(feed, model, gtfs_data)
+    translation_index = importer._form_translation_index(
+        build_translations(gtfs_feed, stops)
+    )
+    return importer, feed, translation_index
@@ -82,6 +82,8 @@ USE_TZ = True
 var_root = env.path("VAR_ROOT")
 MEDIA_ROOT = var_root("media")
 STATIC_ROOT = var_root("static")
+# the last downloaded archive of every GTFS feed is kept here
+GTFS_FEED_CACHE_ROOT = var_root("gtfs_feed_cache")
 MEDIA_URL = env("MEDIA_URL")
 STATIC_URL = env("STATIC_URL")
 